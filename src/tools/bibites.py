@@ -37,8 +37,9 @@ from .lib.bibites_analysis import (
     run_population_analysis, run_spatial_analysis, run_comparison_analysis,
     run_combat_analysis, run_metadata_analysis, run_field_extraction, 
     run_species_field_extraction, run_species_comparison, run_behavioral_analysis,
-    BibitesAnalysisError
+    load_combined_records, BibitesAnalysisError
 )
+from .lib.field_extraction import DEFAULT_BATCH_SIZE
 from .lib.bibites_crosspolinate import run_inject_fittest, run_retag_bulk, BibitesCrossPollinateError
 
 # Import core parsing for error handling
@@ -101,6 +102,8 @@ class BibitesToolError(Exception):
               help='Extract specific fields (comma-separated, e.g. genes.genes.ColorR,genes.genes.ColorG)')
 @click.option('--batch', '-b', is_flag=True, 
               help='Process all files when extracting fields (default for unified tool)')
+@click.option('--batch-size', type=click.IntRange(min=1), default=DEFAULT_BATCH_SIZE, show_default=True,
+              help='Maximum BB8 files per parallel parsing task')
 
 # Cross-Pollination Options
 @click.option('--inject-fittest', is_flag=True,
@@ -138,7 +141,7 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
            behavior: bool, pheromone_focus: str, neural_complexity: bool,
            by_species: bool, species_field: bool, compare_species: Optional[Tuple[int, int]],
            lineage: Optional[str],
-           fields: Optional[str], batch: bool,
+           fields: Optional[str], batch: bool, batch_size: int,
            inject_fittest: bool, source: Optional[str], target: Optional[str], count: int,
            retag: bool, find_tag: Optional[str], replace_tag: Optional[str], 
            dry_run: bool, apply: bool,
@@ -178,6 +181,7 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
     FIELD EXTRACTION:
         --fields FIELD_LIST     Extract specific organism fields
         --batch                 Process all files (automatic in unified tool)
+        --batch-size N          Max files per parallel parsing task
     
     CROSS-POLLINATION:
         --inject-fittest        Inject fittest bibites from source into target save
@@ -302,20 +306,31 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
         
         console.print(f"[green]Running {analysis_count} analysis operation(s)...[/green]\n")
         
+        # Population, species, spatial and combat analyses read the same
+        # dataset; when more than one is requested, parse it once for all
+        combined = [key for key, requested in (('population', population_summary),
+                                               ('species', species_summary),
+                                               ('spatial', spatial_analysis),
+                                               ('combat', combat)) if requested]
+        shared_records = None
+        if len(combined) > 1:
+            console.print("[blue]Extracting shared organism data...[/blue]")
+            shared_records = load_combined_records(data_paths, combined, batch_size=batch_size)
+        
         # Run requested analyses
         if population_summary:
             console.print("[bold cyan]Population Summary Analysis[/bold cyan]")
-            run_population_analysis(data_paths, output, by_species, quick_mode=True)
+            run_population_analysis(data_paths, output, by_species, quick_mode=True, records=shared_records)
             console.print()
         
         if species_summary:
             console.print("[bold cyan]Species Summary Analysis[/bold cyan]")
-            run_population_analysis(data_paths, output, by_species, quick_mode=False)
+            run_population_analysis(data_paths, output, by_species, quick_mode=False, records=shared_records)
             console.print()
         
         if spatial_analysis:
             console.print("[bold cyan]Spatial Distribution Analysis[/bold cyan]")
-            run_spatial_analysis(data_paths, output)
+            run_spatial_analysis(data_paths, output, records=shared_records)
             console.print()
         
         if compare_populations:
@@ -327,7 +342,8 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
             console.print("[bold cyan]Combat Effectiveness Analysis[/bold cyan]")
             if lineage:
                 console.print(f"[blue]Filtering for lineage: {lineage}[/blue]")
-            run_combat_analysis(data_paths, lineage, size_relative=True, output=output)
+            run_combat_analysis(data_paths, lineage, size_relative=True, output=output,
+                                records=shared_records, batch_size=batch_size)
             console.print()
         
         if metadata:
@@ -343,7 +359,8 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
                 console.print("[blue]Focus: Neural complexity[/blue]") 
             else:
                 console.print(f"[blue]Focus: {pheromone_focus.capitalize()} pheromone patterns + neural complexity[/blue]")
-            run_behavioral_analysis(data_paths, pheromone_focus, neural_complexity, by_species, output)
+            run_behavioral_analysis(data_paths, pheromone_focus, neural_complexity, by_species, output,
+                                    batch_size=batch_size)
             console.print()
         
         if species_field:
@@ -359,7 +376,8 @@ def bibites(latest: bool, last: Optional[int], name: Optional[str], list: bool,
         
         if fields:
             console.print("[bold cyan]Field Extraction Analysis[/bold cyan]")
-            run_field_extraction(data_paths, fields, batch=True, output=output, format=format)
+            run_field_extraction(data_paths, fields, batch=True, output=output, format=format,
+                                 batch_size=batch_size)
             console.print()
         
         console.print("[bold green]Analysis complete![/bold green]")
@@ -12,13 +12,15 @@ Usage examples:
   python -m src.tools.extract_metadata --output ./tmp/debug/ Savefiles/exp1.zip
 """
 
+import atexit
 import click
 import zipfile
 import json
 import xml.etree.ElementTree as ET
 import configparser
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -32,6 +34,47 @@ class MetadataExtractionError(Exception):
     """Raised when metadata extraction fails."""
     pass
 
+# Open save zips keyed by resolved path, with the mtime_ns they were opened at.
+# Large saves are expensive to reopen (central directory scan), and several
+# analyses read metadata from the same save in one run.
+_ZIP_HANDLE_CACHE: Dict[Path, Tuple[int, zipfile.ZipFile]] = {}
+
+def _close_zip_handles() -> None:
+    """Close every cached save zip handle."""
+    for _, handle in _ZIP_HANDLE_CACHE.values():
+        handle.close()
+    _ZIP_HANDLE_CACHE.clear()
+
+atexit.register(_close_zip_handles)
+
+def get_zip_handle(zip_path: Path) -> zipfile.ZipFile:
+    """
+    Return an open ZipFile for a save, reusing the cached handle when possible.
+    
+    The handle is reopened if the file has been modified since it was cached.
+    Cached handles stay open until exit, so callers must not close them.
+    
+    Args:
+        zip_path: Path to the save .zip file
+        
+    Returns:
+        Open ZipFile in read mode
+    """
+    resolved = zip_path.resolve()
+    mtime_ns = resolved.stat().st_mtime_ns
+    
+    cached = _ZIP_HANDLE_CACHE.get(resolved)
+    if cached is not None:
+        cached_mtime_ns, handle = cached
+        if cached_mtime_ns == mtime_ns:
+            return handle
+        handle.close()
+        del _ZIP_HANDLE_CACHE[resolved]
+    
+    handle = zipfile.ZipFile(resolved, 'r')
+    _ZIP_HANDLE_CACHE[resolved] = (mtime_ns, handle)
+    return handle
+
 def is_metadata_file(filename: str) -> bool:
     """Check if filename is likely a metadata/config file (not .bb8 or image)."""
     # Exclude .bb8 files and common image formats
@@ -186,7 +229,8 @@ def analyze_binary_file(content: bytes, filename: str) -> Dict[str, Any]:
         'sample_strings': readable_strings[:20]  # First 20 strings
     }
 
-def extract_metadata_from_save(zip_path: Path, output_dir: Path, extract_raw: bool = False) -> Dict[str, Any]:
+def extract_metadata_from_save(zip_path: Path, output_dir: Path, extract_raw: bool = False,
+                               zip_handle: Optional[zipfile.ZipFile] = None) -> Dict[str, Any]:
     """
     Extract ecosystem metadata from a save zip file.
     
@@ -194,6 +238,8 @@ def extract_metadata_from_save(zip_path: Path, output_dir: Path, extract_raw: bo
         zip_path: Path to the save .zip file
         output_dir: Directory for temporary file extraction
         extract_raw: If True, extract all files for examination
+        zip_handle: Open ZipFile for zip_path; defaults to the cached handle
+            from get_zip_handle(). Left open either way.
         
     Returns:
         Dict containing extracted metadata and zone information
@@ -218,7 +264,10 @@ def extract_metadata_from_save(zip_path: Path, output_dir: Path, extract_raw: bo
     }
     
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
+        if zip_handle is None:
+            zip_handle = get_zip_handle(zip_path)
+        
+        with nullcontext(zip_handle) as zip_file:
             # Get all non-.bb8, non-image files
             all_files = zip_file.namelist()
             metadata_files = [f for f in all_files if is_metadata_file(f)]
@@ -19,13 +19,19 @@ Features:
 """
 
 import click
+import os
+import shutil
+import struct
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from rich.console import Console
 from rich.progress import track, Progress
 from rich.table import Table
-import re
 from datetime import datetime
 import glob
 
@@ -36,18 +42,35 @@ AUTOSAVES_PATH = Path("/home/daniel/.local/share/Steam/steamapps/compatdata/2736
 SAVEFILES_PATH = Path("/home/daniel/.local/share/Steam/steamapps/compatdata/2736860/pfx/drive_c/users/steamuser/AppData/LocalLow/The Bibites/The Bibites/Savefiles/")
 DATA_OUTPUT_PATH = Path("data")
 
+# Read buffer for save archives (autosaves are tens of MB)
+ZIP_READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Per-archive member errors shown on the console (all are kept in the stats)
+MAX_REPORTED_ERRORS = 10
+
 class SaveExtractionError(Exception):
     """Raised when save file extraction fails."""
     pass
 
 def is_bb8_file(filename: str) -> bool:
     """Check if filename is a .bb8 file."""
-    return filename.lower().endswith('.bb8')
+    # Lowercase only the suffix, not the whole member path
+    return filename[-4:].lower() == '.bb8'
+
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp'})
+
+def member_basename(filename: str) -> str:
+    """Get the final component of a zip member name ('/' or '\\' separated)."""
+    return filename.rpartition('/')[2].rpartition('\\')[2]
 
 def is_image_file(filename: str) -> bool:
     """Check if filename is an image file."""
-    image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
-    return Path(filename).suffix.lower() in image_extensions
+    basename = member_basename(filename)
+    dot = basename.rfind('.')
+    # Same rule as Path.suffix: no suffix for dotfiles or a trailing dot
+    if dot <= 0 or dot == len(basename) - 1:
+        return False
+    return basename[dot:].lower() in IMAGE_EXTENSIONS
 
 def categorize_bb8_file(filename: str) -> tuple[str, Optional[int]]:
     """
@@ -59,46 +82,143 @@ def categorize_bb8_file(filename: str) -> tuple[str, Optional[int]]:
     Returns:
         Tuple of (category, number) where category is 'bibite', 'egg', or 'unknown'
     """
-    # Normalize path separators and get basename
-    normalized_path = filename.replace('\\', '/')
-    basename = Path(normalized_path).name.lower()
+    # Basename without regex or pathlib: split on either separator, then compare prefix/suffix
+    basename = member_basename(filename)
     
-    # Check if path contains bibites or eggs directory
-    path_parts = normalized_path.lower().split('/')
+    if basename[-4:].lower() != '.bb8':
+        return ('unknown', None)
+    
+    # Save layouts only ever hold bibite_N.bb8 and egg_N.bb8, so dispatch on the
+    # first character and lowercase just the fixed prefix rather than the whole name
+    lead = basename[:1].lower()
     
     # Match bibite_N.bb8 pattern
-    bibite_match = re.match(r'bibite_(\d+)\.bb8$', basename)
-    if bibite_match and ('bibites' in path_parts or 'bibite' in basename):
-        return ('bibite', int(bibite_match.group(1)))
+    if lead == 'b' and basename[:7].lower() == 'bibite_':
+        num_str = basename[7:-4]
+        if num_str.isdecimal():
+            return ('bibite', int(num_str))
     
-    # Match egg_N.bb8 pattern  
-    egg_match = re.match(r'egg_(\d+)\.bb8$', basename)
-    if egg_match and ('eggs' in path_parts or 'egg' in basename):
-        return ('egg', int(egg_match.group(1)))
+    # Match egg_N.bb8 pattern
+    elif lead == 'e' and basename[:4].lower() == 'egg_':
+        num_str = basename[4:-4]
+        if num_str.isdecimal():
+            return ('egg', int(num_str))
     
     return ('unknown', None)
 
+def read_zip_member(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """
+    Read the contents of a zip member.
+    
+    STORED (uncompressed) members are read with a single os.pread at the data
+    offset, bypassing ZipExtFile's buffering layers; the CRC is still verified.
+    Compressed or encrypted members fall back to zip_file.open().
+    
+    Args:
+        zip_file: Open ZipFile in read mode
+        info: ZipInfo of the member to read
+        
+    Returns:
+        Raw member bytes
+        
+    Raises:
+        zipfile.BadZipFile: If the stored member fails its CRC check
+    """
+    if (info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1
+            and hasattr(os, 'pread') and zip_file.fp is not None):
+        fd = zip_file.fp.fileno()
+        header = os.pread(fd, zipfile.sizeFileHeader, info.header_offset)
+        if len(header) == zipfile.sizeFileHeader:
+            fields = struct.unpack(zipfile.structFileHeader, header)
+            if fields[0] == zipfile.stringFileHeader:
+                # Local header is followed by the filename and extra field
+                data_offset = info.header_offset + zipfile.sizeFileHeader + fields[10] + fields[11]
+                data = os.pread(fd, info.file_size, data_offset)
+                if len(data) == info.file_size:
+                    if zlib.crc32(data) != info.CRC:
+                        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+                    return data
+    
+    with zip_file.open(info) as source:
+        return source.read()
+
+def copy_zip_member(source_zip: zipfile.ZipFile, info: zipfile.ZipInfo,
+                    target_zip: zipfile.ZipFile, arcname: str) -> None:
+    """
+    Copy a member into another archive under a new name.
+    
+    The member is streamed from source to target in chunks, keeping its
+    compression method, timestamp and attributes, so it is never held in
+    memory as a whole.
+    
+    Args:
+        source_zip: Open ZipFile in read mode
+        info: ZipInfo of the member to copy
+        target_zip: ZipFile open for writing
+        arcname: Member name in target_zip
+    """
+    copied = zipfile.ZipInfo(arcname, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.external_attr = info.external_attr
+    # Known size up front lets the target decide on zip64 headers correctly
+    copied.file_size = info.file_size
+    with source_zip.open(info) as source, target_zip.open(copied, 'w') as target:
+        shutil.copyfileobj(source, target)
+
+def write_file_bytes(target_path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file with raw os.open/os.write calls.
+    
+    Skips the io.BufferedWriter layer (and its flush on close), which adds
+    nothing when the whole payload is already in memory.
+    
+    Args:
+        target_path: File to create or truncate
+        data: Complete file contents
+    """
+    fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+# Sorted autosave listing, memoized on the autosaves directory's mtime (which
+# changes whenever an autosave is added or removed)
+_AUTOSAVES_CACHE: Dict[tuple, List[Path]] = {}
+
 def get_all_autosaves() -> List[Path]:
     """
     Get all autosave files from the hardcoded autosaves directory.
     
+    The glob and sort are memoized per directory mtime, so the --latest,
+    --last and --name lookups in one process share a single listing.
+    
     Returns:
         List of autosave file paths, sorted by filename (oldest to newest)
         
     Raises:
         SaveExtractionError: If autosaves directory not found or no autosave files
     """
-    if not AUTOSAVES_PATH.exists():
+    try:
+        key = (AUTOSAVES_PATH, AUTOSAVES_PATH.stat().st_mtime_ns)
+    except OSError:
         raise SaveExtractionError(f"Autosaves directory not found: {AUTOSAVES_PATH}")
     
-    # Find all autosave zip files
-    autosave_files = list(AUTOSAVES_PATH.glob('autosave_*.zip'))
+    autosave_files = _AUTOSAVES_CACHE.get(key)
+    if autosave_files is None:
+        # Find all autosave zip files, sorted by filename (which contains timestamp)
+        autosave_files = sorted(AUTOSAVES_PATH.glob('autosave_*.zip'), key=lambda x: x.name)
+        _AUTOSAVES_CACHE.clear()
+        _AUTOSAVES_CACHE[key] = autosave_files
+    
     if not autosave_files:
         raise SaveExtractionError(f"No autosave files found in {AUTOSAVES_PATH}")
     
-    # Sort by filename (which contains timestamp)
-    autosave_files.sort(key=lambda x: x.name)
-    return autosave_files
+    # Callers get their own list, so the memoized one cannot be modified
+    return list(autosave_files)
 
 def get_all_manual_saves() -> List[Path]:
     """
@@ -168,7 +288,7 @@ def get_save_info(save_path: Path) -> Dict[str, Any]:
         try:
             bibites_dir = output_dir / 'bibites'
             if bibites_dir.exists():
-                organism_count = len(list(bibites_dir.glob('*.bb8')))
+                organism_count = _count_bb8(bibites_dir)
         except:
             pass
     
@@ -195,15 +315,13 @@ def list_all_saves() -> List[Dict[str, Any]]:
         List of save info dictionaries
     """
     all_saves = get_all_saves()
-    save_info_list = []
     
-    # Process autosaves
-    for save in all_saves['autosaves']:
-        save_info_list.append(get_save_info(save))
-    
-    # Process manual saves
-    for save in all_saves['manual']:
-        save_info_list.append(get_save_info(save))
+    # Autosaves then manual saves; each info is a stat plus scans of the
+    # extracted directory, all blocking syscalls that release the GIL, so a
+    # thread pool overlaps them across saves
+    saves = all_saves['autosaves'] + all_saves['manual']
+    with ThreadPoolExecutor() as executor:
+        save_info_list = list(executor.map(get_save_info, saves))
     
     # Sort by modification time (newest first)
     save_info_list.sort(key=lambda x: x['modified'], reverse=True)
@@ -355,6 +473,66 @@ def get_output_directory(zip_path: Path) -> Path:
     filename = zip_path.stem
     return DATA_OUTPUT_PATH / filename
 
+def _scan_cache(output_dir: Path) -> Dict[str, int]:
+    """
+    Count cached files under an output directory in a single os.scandir walk.
+    
+    .bb8 files directly inside bibites/ and eggs/ are counted per category; any
+    other .bb8 file in the tree counts as unknown. Every entry directly inside
+    images/ counts as an image.
+    
+    Args:
+        output_dir: Directory to scan for cached data
+        
+    Returns:
+        Dict with 'bibites', 'eggs', 'unknown' and 'images' counts (all zero if
+        the directory does not exist)
+    """
+    counts = {'bibites': 0, 'eggs': 0, 'unknown': 0, 'images': 0}
+    
+    # Stack of (directory, top-level subdirectory name, depth) still to scan
+    pending = [(os.fspath(output_dir), None, 0)]
+    while pending:
+        dir_path, top_level, depth = pending.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if depth == 1 and top_level == 'images':
+                        counts['images'] += 1
+                    if entry.is_dir():
+                        pending.append((entry.path, top_level or entry.name, depth + 1))
+                    elif entry.name.endswith('.bb8'):
+                        if depth == 1 and top_level in ('bibites', 'eggs'):
+                            counts[top_level] += 1
+                        else:
+                            counts['unknown'] += 1
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    
+    return counts
+
+def _count_bb8(directory: Path) -> int:
+    """Count .bb8 files directly inside a directory without materializing a listing."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.bb8'))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+def _contains_bb8(directory: str) -> bool:
+    """Recursively check a directory for any .bb8 file, stopping at the first hit."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.bb8'):
+                    return True
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return any(_contains_bb8(subdir) for subdir in subdirs)
+
 def is_directory_cached(output_dir: Path) -> bool:
     """
     Check if output directory exists and contains extracted data.
@@ -365,20 +543,19 @@ def is_directory_cached(output_dir: Path) -> bool:
     Returns:
         True if directory exists and has content, False otherwise
     """
-    if not output_dir.exists():
-        return False
-        
     # Check if directory has any .bb8 files (main indicator of successful extraction)
-    bb8_files = list(output_dir.rglob('*.bb8'))
-    return len(bb8_files) > 0
+    return _contains_bb8(os.fspath(output_dir))
 
-def extract_save_files(zip_path: Path, output_dir: Path) -> Dict[str, Any]:
+def extract_save_files(zip_path: Path, output_dir: Path,
+                       messages: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Extract all .bb8 files and images from a save zip file.
     
     Args:
         zip_path: Path to the save .zip file
         output_dir: Directory to extract files to
+        messages: If given, status lines (rich markup) are appended here
+            instead of printed, so a caller in another process can print them
         
     Returns:
         Dict with extraction statistics
@@ -411,78 +588,91 @@ def extract_save_files(zip_path: Path, output_dir: Path) -> Dict[str, Any]:
         'errors': []
     }
     
+    report = console.print if messages is None else messages.append
+    
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            # Get all .bb8 files and images in the archive
-            bb8_files = [name for name in zip_file.namelist() if is_bb8_file(name)]
-            image_files = [name for name in zip_file.namelist() if is_image_file(name)]
+        # Large read buffer cuts read syscalls for the central directory scan and member reads
+        with open(zip_path, 'rb', buffering=ZIP_READ_BUFFER_SIZE) as zip_fp, zipfile.ZipFile(zip_fp, 'r') as zip_file:
+            # Get all .bb8 files and images in the archive in one pass over the central directory
+            bb8_files = []
+            image_files = []
+            for info in zip_file.infolist():
+                if is_bb8_file(info.filename):
+                    bb8_files.append(info)
+                elif is_image_file(info.filename):
+                    image_files.append(info)
             
             if not bb8_files and not image_files:
-                console.print(f"[yellow]No .bb8 files or images found in {zip_path.name}[/yellow]")
+                report(f"[yellow]No .bb8 files or images found in {zip_path.name}[/yellow]")
                 return stats
             
-            console.print(f"[blue]Found {len(bb8_files)} .bb8 files and {len(image_files)} images in {zip_path.name}[/blue]")
+            report(f"[blue]Found {len(bb8_files)} .bb8 files and {len(image_files)} images in {zip_path.name}[/blue]")
+            
+            # Classify every member up front so the extraction loop only dispatches
+            categorized_files = [(info, *categorize_bb8_file(info.filename)) for info in bb8_files]
+            category_targets = {
+                'bibite': (bibites_dir, 'bibites'),
+                'egg': (eggs_dir, 'eggs'),
+            }
+            
+            # Create the unknown directory once, and only if something will land in it
+            if any(category not in category_targets for _, category, _ in categorized_files):
+                unknown_dir.mkdir(parents=True, exist_ok=True)
             
-            for file_path in bb8_files:
+            for info, category, number in categorized_files:
                 try:
-                    category, number = categorize_bb8_file(file_path)
-                    
                     # Determine output location and filename
-                    if category == 'bibite':
-                        target_dir = bibites_dir
-                        target_name = f"bibite_{number}.bb8"
-                        stats['bibites'] += 1
-                    elif category == 'egg':
-                        target_dir = eggs_dir  
-                        target_name = f"egg_{number}.bb8"
-                        stats['eggs'] += 1
+                    known_target = category_targets.get(category)
+                    if known_target is not None:
+                        target_dir, stats_key = known_target
+                        target_name = f"{category}_{number}.bb8"
+                        stats[stats_key] += 1
                     else:
-                        # Unknown category - create directory if needed and preserve name
-                        unknown_dir.mkdir(parents=True, exist_ok=True)
+                        # Unknown category - preserve name
                         target_dir = unknown_dir
-                        target_name = Path(file_path).name
+                        target_name = member_basename(info.filename)
                         stats['unknown'] += 1
                     
                     target_path = target_dir / target_name
                     
                     # Extract the file
-                    with zip_file.open(file_path) as source:
-                        with open(target_path, 'wb') as target:
-                            target.write(source.read())
+                    write_file_bytes(target_path, read_zip_member(zip_file, info))
                     
                 except Exception as e:
-                    error_msg = f"Failed to extract {file_path}: {e}"
-                    stats['errors'].append(error_msg)
-                    console.print(f"[red]{error_msg}[/red]")
+                    stats['errors'].append(f"Failed to extract {info.filename}: {e}")
             
-            # Extract image files
-            for file_path in image_files:
+            # Extract image files, tracking used names in memory instead of probing the disk
+            used_image_names = set(os.listdir(images_dir))
+            for info in image_files:
                 try:
                     # Use original filename for images
-                    target_name = Path(file_path).name
-                    target_path = images_dir / target_name
+                    target_name = member_basename(info.filename)
                     
                     # Handle duplicate filenames by adding number suffix
-                    if target_path.exists():
-                        stem = target_path.stem
-                        suffix = target_path.suffix
+                    if target_name in used_image_names:
+                        base_path = Path(target_name)
+                        stem = base_path.stem
+                        suffix = base_path.suffix
                         counter = 1
-                        while target_path.exists():
+                        while target_name in used_image_names:
                             target_name = f"{stem}_{counter}{suffix}"
-                            target_path = images_dir / target_name
                             counter += 1
                     
                     # Extract the image file
-                    with zip_file.open(file_path) as source:
-                        with open(target_path, 'wb') as target:
-                            target.write(source.read())
+                    write_file_bytes(images_dir / target_name, read_zip_member(zip_file, info))
+                    used_image_names.add(target_name)
                     
                     stats['images'] += 1
                     
                 except Exception as e:
-                    error_msg = f"Failed to extract image {file_path}: {e}"
-                    stats['errors'].append(error_msg)
-                    console.print(f"[red]{error_msg}[/red]")
+                    stats['errors'].append(f"Failed to extract image {info.filename}: {e}")
+        
+        # Report member errors once per archive rather than printing each as it happens
+        if stats['errors']:
+            for error_msg in stats['errors'][:MAX_REPORTED_ERRORS]:
+                report(f"[red]{error_msg}[/red]")
+            if len(stats['errors']) > MAX_REPORTED_ERRORS:
+                report(f"[red]... and {len(stats['errors']) - MAX_REPORTED_ERRORS} more errors[/red]")
         
         return stats
                     
@@ -491,6 +681,47 @@ def extract_save_files(zip_path: Path, output_dir: Path) -> Dict[str, Any]:
     except Exception as e:
         raise SaveExtractionError(f"Error extracting {zip_path}: {e}")
 
+def _extract_job(zip_path: Path, overwrite: bool) -> Dict[str, Any]:
+    """
+    Extract a save into its data/ output directory, or report its cached stats.
+    
+    Module-level so it can be pickled and run in a ProcessPoolExecutor worker.
+    Nothing is printed here; status lines come back in 'messages' so the parent
+    can print them without garbling its progress display.
+    
+    Args:
+        zip_path: Path to the save .zip file
+        overwrite: Re-extract even if cached data exists
+        
+    Returns:
+        Dict with extraction statistics, including 'cached' and 'messages'
+        
+    Raises:
+        SaveExtractionError: If extraction fails
+    """
+    output_dir = get_output_directory(zip_path)
+    
+    # Check cache first (unless overwrite requested); one scan yields both
+    # the cache decision and the cached stats
+    cache_counts = None if overwrite else _scan_cache(output_dir)
+    if cache_counts and cache_counts['bibites'] + cache_counts['eggs'] + cache_counts['unknown'] > 0:
+        return {
+            'save_name': zip_path.stem,
+            'bibites': cache_counts['bibites'],
+            'eggs': cache_counts['eggs'],
+            'unknown': cache_counts['unknown'],
+            'images': cache_counts['images'],
+            'errors': [],
+            'cached': True,
+            'messages': [f"[blue]Using cached data from {output_dir}[/blue]"]
+        }
+    
+    messages = []
+    stats = extract_save_files(zip_path, output_dir, messages=messages)
+    stats['cached'] = False
+    stats['messages'] = messages
+    return stats
+
 @click.command()
 @click.option('--latest', is_flag=True,
               help='Extract the latest autosave file')
@@ -553,69 +784,59 @@ def extract_save(latest: bool, last: Optional[int], name: Optional[str], overwri
     total_images = 0
     total_errors = 0
     cached_files = 0
-    output_paths = []
+    
+    # Per-save success flag for the final paths report, so it needs no stat calls
+    extracted_ok = {}
     
     with Progress() as progress:
         task = progress.add_task("[green]Processing autosaves...", total=len(zip_files))
         
-        for zip_file in zip_files:
-            try:
-                # Get output directory for this autosave
-                output_dir = get_output_directory(zip_file)
-                output_paths.append(output_dir)
-                
-                # Check cache first (unless overwrite requested)
-                if not overwrite and is_directory_cached(output_dir):
-                    console.print(f"[blue]Using cached data from {output_dir}[/blue]")
-                    cached_files += 1
+        # Archives are independent and inflating them is CPU-bound, so several are
+        # extracted in worker processes; a single archive runs in-process rather
+        # than paying for a pool. Results are reported in input order either way.
+        max_workers = min(len(zip_files), os.cpu_count() or 1)
+        with ExitStack() as stack:
+            if max_workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+                futures = [executor.submit(_extract_job, zip_file, overwrite) for zip_file in zip_files]
+                outcomes = (future.result for future in futures)
+            else:
+                outcomes = (partial(_extract_job, zip_file, overwrite) for zip_file in zip_files)
+            
+            for zip_file, outcome in zip(zip_files, outcomes):
+                try:
+                    stats = outcome()
+                    all_stats.append(stats)
+                    extracted_ok[zip_file] = True
                     
-                    # Generate stats from cached files
-                    bb8_files = list(output_dir.rglob('*.bb8'))
-                    image_files = list((output_dir / 'images').glob('*')) if (output_dir / 'images').exists() else []
+                    total_bibites += stats['bibites']
+                    total_eggs += stats['eggs'] 
+                    total_unknown += stats['unknown']
+                    total_images += stats['images']
+                    total_errors += len(stats['errors'])
                     
-                    # Count bibites vs eggs from cached files
-                    bibites_count = len(list((output_dir / 'bibites').glob('*.bb8'))) if (output_dir / 'bibites').exists() else 0
-                    eggs_count = len(list((output_dir / 'eggs').glob('*.bb8'))) if (output_dir / 'eggs').exists() else 0
-                    unknown_count = len(bb8_files) - bibites_count - eggs_count
+                    # Display individual file results
+                    for message in stats['messages']:
+                        console.print(message)
+                    if stats['cached']:
+                        cached_files += 1
+                        console.print(f"[cyan]✓ {zip_file.name} (cached):[/cyan] "
+                                    f"{stats['bibites']} bibites, {stats['eggs']} eggs, {stats['images']} images"
+                                    + (f", {stats['unknown']} unknown" if stats['unknown'] > 0 else ""))
+                    else:
+                        console.print(f"[green]✓ {zip_file.name}:[/green] "
+                                    f"{stats['bibites']} bibites, {stats['eggs']} eggs, {stats['images']} images"
+                                    + (f", {stats['unknown']} unknown" if stats['unknown'] > 0 else "")
+                                    + (f", {len(stats['errors'])} errors" if stats['errors'] else ""))
                     
-                    stats = {
-                        'save_name': zip_file.stem,
-                        'bibites': bibites_count,
-                        'eggs': eggs_count,
-                        'unknown': max(0, unknown_count),
-                        'images': len(image_files),
-                        'errors': [],
-                        'cached': True
-                    }
-                else:
-                    # Extract the autosave
-                    stats = extract_save_files(zip_file, output_dir)
-                    stats['cached'] = False
-                
-                all_stats.append(stats)
-                
-                total_bibites += stats['bibites']
-                total_eggs += stats['eggs'] 
-                total_unknown += stats['unknown']
-                total_images += stats['images']
-                total_errors += len(stats['errors'])
-                
-                # Display individual file results
-                if stats.get('cached', False):
-                    console.print(f"[cyan]✓ {zip_file.name} (cached):[/cyan] "
-                                f"{stats['bibites']} bibites, {stats['eggs']} eggs, {stats['images']} images"
-                                + (f", {stats['unknown']} unknown" if stats['unknown'] > 0 else ""))
-                else:
-                    console.print(f"[green]✓ {zip_file.name}:[/green] "
-                                f"{stats['bibites']} bibites, {stats['eggs']} eggs, {stats['images']} images"
-                                + (f", {stats['unknown']} unknown" if stats['unknown'] > 0 else "")
-                                + (f", {len(stats['errors'])} errors" if stats['errors'] else ""))
+                except Exception as e:
+                    # Besides SaveExtractionError, a dead worker (BrokenProcessPool) or an
+                    # OSError surfaces here; report it against this archive and keep going
+                    console.print(f"[red]✗ {zip_file.name}: {e}[/red]")
+                    extracted_ok[zip_file] = False
+                    total_errors += 1
                 
-            except SaveExtractionError as e:
-                console.print(f"[red]✗ {zip_file.name}: {e}[/red]")
-                total_errors += 1
-            
-            progress.advance(task)
+                progress.advance(task)
     
     # Summary table
     console.print("\n[bold]Extraction Summary[/bold]")
@@ -639,8 +860,9 @@ def extract_save(latest: bool, last: Optional[int], name: Optional[str], overwri
     
     # Display data paths for chaining with analysis tools
     console.print("\n[bold]Data Available At:[/bold]")
-    for path in output_paths:
-        if path.exists():
+    for zip_file in zip_files:
+        path = get_output_directory(zip_file)
+        if extracted_ok.get(zip_file, False):
             console.print(f"[green]{path.resolve()}[/green]")
         else:
             console.print(f"[red]{path.resolve()} (extraction failed)[/red]")
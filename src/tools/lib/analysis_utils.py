@@ -6,16 +6,53 @@ duplication and standardize analysis patterns. This module leverages existing
 infrastructure from field_extraction.py, population_analysis.py, and output_formatters.py.
 """
 
-import json
+import heapq
+import mmap
+import orjson
+import os
 import statistics
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Union
-from collections import defaultdict, Counter
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
+# Routine progress lines can be silenced for pipeline use with BIBITES_VERBOSE=0;
+# warnings are always shown
+_VERBOSE = os.environ.get('BIBITES_VERBOSE', '1') != '0'
+
+
+def _status(message: str) -> None:
+    """Print a routine progress line unless verbose output is disabled."""
+    if _VERBOSE:
+        console.print(message)
+
+
+# Minimal fields that most analysis tools expect on every organism record
+REQUIRED_BASE_FIELDS = ('genes.tag', 'genes.speciesID')
+REQUIRED_BASE_FIELDS_SET = frozenset(REQUIRED_BASE_FIELDS)
+
+# Exports above this size are parsed from a memory map instead of a heap copy
+LARGE_EXPORT_BYTES = 100 * 1024 * 1024
+
+
+def _read_json_file(data_path: Path) -> Any:
+    """Parse a JSON file with orjson, memory-mapping large files.
+    
+    Small files are read in one call; large exports are parsed straight from an
+    mmap so the raw bytes never occupy a second copy in the Python heap.
+    """
+    if data_path.stat().st_size <= LARGE_EXPORT_BYTES:
+        return orjson.loads(data_path.read_bytes())
+    
+    with open(data_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
 
 def load_and_validate_organism_data(data_path: Union[str, Path]) -> List[Dict]:
     """Load organism data from JSON file and validate structure.
@@ -39,9 +76,8 @@ def load_and_validate_organism_data(data_path: Union[str, Path]) -> List[Dict]:
         raise FileNotFoundError(f"Data file not found: {data_path}")
     
     try:
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = _read_json_file(data_path)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {data_path}: {e}")
     
     if not isinstance(data, list):
@@ -55,13 +91,13 @@ def load_and_validate_organism_data(data_path: Union[str, Path]) -> List[Dict]:
         if not isinstance(organism, dict):
             raise ValueError(f"Organism {i} is not a dictionary")
         
-        # Check for minimal required fields that most analysis tools expect
-        required_base_fields = ['genes.tag', 'genes.speciesID']
-        missing_fields = [field for field in required_base_fields if field not in organism]
-        if missing_fields:
+        # Check for minimal required fields that most analysis tools expect; the
+        # missing-field list is only built for organisms that fail the check
+        if not REQUIRED_BASE_FIELDS_SET <= organism.keys():
+            missing_fields = [field for field in REQUIRED_BASE_FIELDS if field not in organism]
             console.print(f"[yellow]Warning: Organism {i} missing fields: {missing_fields}[/yellow]")
     
-    console.print(f"[green]Loaded {len(data)} organisms from {data_path.name}[/green]")
+    _status(f"[green]Loaded {len(data)} organisms from {data_path.name}[/green]")
     return data
 
 
@@ -79,32 +115,35 @@ def group_organisms_by_species(organisms: List[Dict], by_sim_id: bool = False) -
         Dictionary mapping species identifier to list of organisms
     """
     if by_sim_id:
-        console.print(f"[blue]Grouping {len(organisms)} organisms by sim-generated species ID...[/blue]")
+        _status(f"[blue]Grouping {len(organisms)} organisms by sim-generated species ID...[/blue]")
         species_field = 'genes.speciesID'
     else:
-        console.print(f"[blue]Grouping {len(organisms)} organisms by hereditary tag...[/blue]")
+        _status(f"[blue]Grouping {len(organisms)} organisms by hereditary tag...[/blue]")
         species_field = 'genes.tag'
     
     species_groups = defaultdict(list)
-    
     for organism in organisms:
         species_id = organism.get(species_field, 'Unknown')
-        species_groups[str(species_id)].append(organism)
+        # Tags are usually already strings; only convert numeric species IDs
+        species_groups[species_id if type(species_id) is str else str(species_id)].append(organism)
     
-    # Convert to regular dict and sort by population size
-    result = dict(species_groups)
-    sorted_species = sorted(result.keys(), key=lambda x: len(result[x]), reverse=True)
+    # Build the result largest species first; the stable sort keeps first-seen
+    # order among equally sized species
+    result = dict(sorted(species_groups.items(), key=lambda kv: len(kv[1]), reverse=True))
     
-    console.print(f"[green]Found {len(sorted_species)} species groups[/green]")
-    for species in sorted_species[:5]:  # Show top 5
-        console.print(f"  {species}: {len(result[species])} organisms")
-    if len(sorted_species) > 5:
-        console.print(f"  ... and {len(sorted_species) - 5} more species")
+    # One print for the whole block so rich parses markup once, not per line
+    summary_lines = [f"[green]Found {len(result)} species groups[/green]"]
+    summary_lines.extend(f"  {species}: {len(members)} organisms"
+                         for species, members in islice(result.items(), 5))  # Show top 5
+    if len(result) > 5:
+        summary_lines.append(f"  ... and {len(result) - 5} more species")
+    _status("\n".join(summary_lines))
     
     return result
 
 
-def calculate_rankings(values: Dict[str, float], metric_name: str, higher_better: bool = True) -> List[Tuple[str, float, int]]:
+def calculate_rankings(values: Dict[str, float], metric_name: str, higher_better: bool = True,
+                       top_k: Optional[int] = None) -> List[Tuple[str, float, int]]:
     """Calculate rankings for species based on a metric value.
     
     Standardizes the ranking pattern used in multiple ad-hoc analysis tools.
@@ -113,6 +152,7 @@ def calculate_rankings(values: Dict[str, float], metric_name: str, higher_better
         values: Dictionary mapping species/organism ID to metric value
         metric_name: Human-readable name for the metric (for console output)
         higher_better: If True, higher values rank better; if False, lower values rank better
+        top_k: If given, only rank the best top_k entries (partial selection instead of a full sort)
         
     Returns:
         List of tuples (species_id, value, rank) sorted by rank
@@ -120,18 +160,35 @@ def calculate_rankings(values: Dict[str, float], metric_name: str, higher_better
     if not values:
         return []
     
-    # Sort by value
-    sorted_items = sorted(values.items(), key=lambda x: x[1], reverse=higher_better)
+    # Sort by value, or select only the top_k entries when that is all the caller needs
+    if top_k is not None:
+        select_top = heapq.nlargest if higher_better else heapq.nsmallest
+        sorted_items = select_top(top_k, values.items(), key=itemgetter(1))
+    else:
+        sorted_items = sorted(values.items(), key=itemgetter(1), reverse=higher_better)
     
     # Add rank information
     rankings = [(species_id, value, rank + 1) for rank, (species_id, value) in enumerate(sorted_items)]
     
     direction = "higher" if higher_better else "lower"
-    console.print(f"[blue]Calculated {metric_name} rankings ({direction} is better)[/blue]")
+    _status(f"[blue]Calculated {metric_name} rankings ({direction} is better)[/blue]")
     
     return rankings
 
 
+# Pre-bound "%.2f" formatter: skips re-parsing an f-string format spec per cell
+_format_float_2dp = "%.2f".__mod__
+
+
+def _format_cell(value: Any) -> str:
+    """Format a single analysis table cell."""
+    if value is None:
+        return "[dim]None[/dim]"
+    if isinstance(value, float):
+        return _format_float_2dp(value)
+    return str(value)
+
+
 def create_analysis_table(data: Dict[str, Dict[str, Any]], title: str, columns: List[str]) -> Table:
     """Create a standardized Rich table for analysis results.
     
@@ -155,34 +212,79 @@ def create_analysis_table(data: Dict[str, Dict[str, Any]], title: str, columns:
     for column in columns:
         table.add_column(column, style="green")
     
-    # Sort rows by first numeric column if available, otherwise alphabetically
-    try:
-        numeric_col = next(col for col in columns 
-                          if any(isinstance(row_data.get(col), (int, float)) 
-                               for row_data in data.values()))
-        sorted_rows = sorted(data.items(), 
-                           key=lambda x: x[1].get(numeric_col, 0), 
-                           reverse=True)
-    except StopIteration:
-        sorted_rows = sorted(data.items())
-    
-    # Add rows
+    # Sort rows by first numeric column if available, otherwise alphabetically.
+    # The sort column is resolved once up front, then each row's sort value is
+    # read exactly once (decorate-sort-undecorate) rather than inside a key lambda
+    rows = list(data.items())
+    numeric_col = next((col for col in columns
+                        if any(isinstance(row_data.get(col), (int, float)) for _, row_data in rows)),
+                       None)
+    if numeric_col is not None:
+        decorated = [(row_data.get(numeric_col, 0), index) for index, (_, row_data) in enumerate(rows)]
+        decorated.sort(key=itemgetter(0), reverse=True)
+        sorted_rows = [rows[index] for _, index in decorated]
+    else:
+        sorted_rows = sorted(rows)
+    
+    # Add rows, building each row's cells with one comprehension
     for row_id, row_data in sorted_rows:
-        row_values = [str(row_id)]
-        for column in columns:
-            value = row_data.get(column)
-            if value is None:
-                row_values.append("[dim]None[/dim]")
-            elif isinstance(value, float):
-                row_values.append(f"{value:.2f}")
-            else:
-                row_values.append(str(value))
-        
-        table.add_row(*row_values)
+        table.add_row(str(row_id), *[_format_cell(row_data.get(column)) for column in columns])
     
     return table
 
 
+def _combat_insights(analysis_results: Dict[str, Any], total: int) -> List[str]:
+    """Combat-pressure insights for generate_insights()."""
+    if 'total_combatants' not in analysis_results:
+        return []
+    
+    combat_rate = (analysis_results['total_combatants'] / total) * 100
+    if combat_rate > 40:
+        return ["🔥 High combat pressure - ecosystem in active warfare"]
+    if combat_rate > 25:
+        return ["⚔️  Moderate combat - balanced predator-prey dynamics"]
+    return ["🕊️  Low combat - peaceful ecosystem"]
+
+
+def _reproduction_insights(analysis_results: Dict[str, Any], total: int) -> List[str]:
+    """Reproductive-activity insights for generate_insights()."""
+    if 'total_parents' not in analysis_results:
+        return []
+    
+    repro_rate = (analysis_results['total_parents'] / total) * 100
+    if repro_rate > 30:
+        return ["🥚 High reproductive activity - population growth phase"]
+    if repro_rate < 10:
+        return ["⚠️  Low reproductive activity - population may decline"]
+    return ["📈 Balanced reproductive activity"]
+
+
+def _evolution_insights(analysis_results: Dict[str, Any], total: int) -> List[str]:
+    """Generation-spread insights for generate_insights()."""
+    if 'generation_range' not in analysis_results:
+        return []
+    
+    gen_range = analysis_results['generation_range']
+    insights = [f"🧬 Generation spread: {gen_range}"]
+    
+    if isinstance(gen_range, tuple) and len(gen_range) == 2:
+        min_gen, max_gen = gen_range
+        if max_gen - min_gen > 50:
+            insights.append("📈 Long evolutionary history - mature ecosystem")
+        elif max_gen - min_gen < 10:
+            insights.append("🆕 Recent speciation event or population bottleneck")
+    
+    return insights
+
+
+# Context name -> handler(analysis_results, total) for generate_insights()
+_CONTEXT_HANDLERS = {
+    "combat": _combat_insights,
+    "reproduction": _reproduction_insights,
+    "evolution": _evolution_insights,
+}
+
+
 def generate_insights(analysis_results: Dict[str, Any], context: str) -> List[str]:
     """Generate standardized insights from analysis results.
     
@@ -197,10 +299,11 @@ def generate_insights(analysis_results: Dict[str, Any], context: str) -> List[st
         List of insight strings ready for console output
     """
     insights = []
+    # Shared by the population and context-specific insights
+    total = analysis_results.get('total_organisms', 1)
     
     # Population insights
     if 'total_organisms' in analysis_results:
-        total = analysis_results['total_organisms']
         insights.append(f"📊 Ecosystem contains {total} organisms")
         
         if total < 50:
@@ -221,43 +324,9 @@ def generate_insights(analysis_results: Dict[str, Any], context: str) -> List[st
             insights.append("🌟 High species diversity indicates active speciation")
     
     # Context-specific insights
-    if context == "combat":
-        if 'total_combatants' in analysis_results:
-            combatants = analysis_results['total_combatants']
-            total = analysis_results.get('total_organisms', 1)
-            combat_rate = (combatants / total) * 100
-            
-            if combat_rate > 40:
-                insights.append("🔥 High combat pressure - ecosystem in active warfare")
-            elif combat_rate > 25:
-                insights.append("⚔️  Moderate combat - balanced predator-prey dynamics")
-            else:
-                insights.append("🕊️  Low combat - peaceful ecosystem")
-    
-    elif context == "reproduction":
-        if 'total_parents' in analysis_results:
-            parents = analysis_results['total_parents']
-            total = analysis_results.get('total_organisms', 1)
-            repro_rate = (parents / total) * 100
-            
-            if repro_rate > 30:
-                insights.append("🥚 High reproductive activity - population growth phase")
-            elif repro_rate < 10:
-                insights.append("⚠️  Low reproductive activity - population may decline")
-            else:
-                insights.append("📈 Balanced reproductive activity")
-    
-    elif context == "evolution":
-        if 'generation_range' in analysis_results:
-            gen_range = analysis_results['generation_range']
-            insights.append(f"🧬 Generation spread: {gen_range}")
-            
-            if isinstance(gen_range, tuple) and len(gen_range) == 2:
-                min_gen, max_gen = gen_range
-                if max_gen - min_gen > 50:
-                    insights.append("📈 Long evolutionary history - mature ecosystem")
-                elif max_gen - min_gen < 10:
-                    insights.append("🆕 Recent speciation event or population bottleneck")
+    handler = _CONTEXT_HANDLERS.get(context)
+    if handler is not None:
+        insights.extend(handler(analysis_results, total))
     
     # Performance insights
     if 'top_performers' in analysis_results:
@@ -276,6 +345,37 @@ def generate_insights(analysis_results: Dict[str, Any], context: str) -> List[st
     return insights
 
 
+def _organisms_to_columns(organisms: List[Dict], fields: List[str]) -> Dict[str, List[float]]:
+    """Convert organism records into one list of numeric values per field.
+    
+    Walks the organisms once; non-numeric and missing values are skipped, so
+    each column may be shorter than the organism list.
+    
+    Args:
+        organisms: List of organism dictionaries
+        fields: Field names to extract
+        
+    Returns:
+        Dictionary mapping field name to list of float values
+    """
+    columns = {field: [] for field in fields}
+    
+    # Local aliases keep the hot loop on fast local lookups instead of globals/attributes
+    _isinstance = isinstance
+    _float = float
+    _numeric = (int, float)
+    field_appends = [(field, columns[field].append) for field in fields]
+    
+    for organism in organisms:
+        organism_get = organism.get
+        for field, column_append in field_appends:
+            value = organism_get(field)
+            if _isinstance(value, _numeric):
+                column_append(_float(value))
+    
+    return columns
+
+
 def calculate_species_statistics(species_groups: Dict[str, List[Dict]], metrics: List[str]) -> Dict[str, Dict[str, float]]:
     """Calculate statistical summaries for each species across specified metrics.
     
@@ -296,14 +396,11 @@ def calculate_species_statistics(species_groups: Dict[str, List[Dict]], metrics:
     for species_id, organisms in species_groups.items():
         species_stats[species_id] = {}
         
+        # Extract numeric values for every metric in one pass over the organisms
+        columns = _organisms_to_columns(organisms, metrics)
+        
         for metric in metrics:
-            # Extract numeric values for this metric
-            values = []
-            for organism in organisms:
-                value = organism.get(metric)
-                if isinstance(value, (int, float)):
-                    values.append(float(value))
-            
+            values = columns[metric]
             if values:
                 stats = calculate_stats(values)
                 species_stats[species_id][metric] = stats
@@ -325,14 +422,11 @@ def filter_mature_organisms(organisms: List[Dict], size_threshold: float = 0.5)
     Returns:
         List of mature organisms
     """
-    mature_organisms = []
+    # Single comprehension: the size test runs without per-item append/method dispatch
+    mature_organisms = [organism for organism in organisms
+                        if (organism.get('body.d2Size') or 0.0) >= size_threshold]
     
-    for organism in organisms:
-        size = organism.get('body.d2Size', 0.0) or 0.0
-        if size >= size_threshold:
-            mature_organisms.append(organism)
-    
-    console.print(f"[blue]Filtered to {len(mature_organisms)} mature organisms (size ≥ {size_threshold})[/blue]")
+    _status(f"[blue]Filtered to {len(mature_organisms)} mature organisms (size ≥ {size_threshold})[/blue]")
     return mature_organisms
 
 
@@ -357,14 +451,11 @@ def find_top_performers(organisms: List[Dict], metric_field: str, count: int = 5
         console.print(f"[yellow]Warning: No organisms found with metric '{metric_field}'[/yellow]")
         return []
     
-    # Sort by metric
-    sorted_organisms = sorted(valid_organisms, 
-                            key=lambda x: x[metric_field], 
-                            reverse=higher_better)
-    
-    top_performers = sorted_organisms[:count]
+    # Partial selection: O(N log count) instead of sorting every organism
+    select_top = heapq.nlargest if higher_better else heapq.nsmallest
+    top_performers = select_top(count, valid_organisms, key=itemgetter(metric_field))
     
     direction = "highest" if higher_better else "lowest"
-    console.print(f"[green]Found {len(top_performers)} top performers by {metric_field} ({direction} values)[/green]")
+    _status(f"[green]Found {len(top_performers)} top performers by {metric_field} ({direction} values)[/green]")
     
     return top_performers
\ No newline at end of file
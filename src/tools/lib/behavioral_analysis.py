@@ -10,8 +10,10 @@ Preserves algorithms from existing ad-hoc analysis tools while providing
 modular interface for integration into unified bibites analysis system.
 """
 
+import math
 import statistics
-from collections import defaultdict
+from itertools import repeat
+from operator import itemgetter, truediv
 from typing import Dict, Any, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
@@ -20,15 +22,175 @@ from .analysis_utils import group_organisms_by_species
 
 console = Console()
 
+# Pheromone node description -> pheromone_data key
+PHERO_KEY_MAP = {
+    'PhereOut1': 'phero_out_1',      # Red pheromone output
+    'PhereOut2': 'phero_out_2',      # Green pheromone output
+    'PhereOut3': 'phero_out_3',      # Blue pheromone output
+    'PheroSense1': 'phero_sense_1',  # Red pheromone detection
+    'PheroSense2': 'phero_sense_2',  # Green pheromone detection
+    'PheroSense3': 'phero_sense_3',  # Blue pheromone detection
+}
+
+# Membership gate for the node loops: most brain nodes are not pheromone nodes
+PHERO_NAMES = frozenset(PHERO_KEY_MAP)
+
+
+def compact_brain_nodes(organisms: List[Dict]) -> List[Dict]:
+    """Replace each organism's brain.Nodes dicts with (Desc, Value) tuples in place.
+    
+    The pheromone scans read compact nodes by tuple unpacking instead of two
+    dict lookups per node. Call once after loading when the organisms are only
+    used for behavioral analysis; node counts are unaffected.
+    
+    Args:
+        organisms: List of organism dictionaries with neural data
+        
+    Returns:
+        The same list, for chaining
+    """
+    for organism in organisms:
+        nodes = organism.get('brain.Nodes')
+        if nodes and type(nodes[0]) is not tuple:
+            organism['brain.Nodes'] = [(node.get('Desc'), node.get('Value', 0.0)) for node in nodes]
+    return organisms
+
+
+def build_behavioral_columns(organisms: List[Dict]) -> Dict[str, List]:
+    """Extract every per-organism field the behavioral analyzers read in one pass.
+    
+    Pass the result as columns= to analyze_pheromone_patterns(),
+    calculate_neural_complexity() and classify_behavioral_strategies() so that
+    running several analyzers over the same organisms reads each organism dict
+    only once.
+    
+    Args:
+        organisms: List of organism dictionaries with neural data
+        
+    Returns:
+        Dict of aligned lists: species_key, tag, generation, nodes, node_count,
+        synapse_count and complexity (synapses per node)
+    """
+    species_keys = []
+    tags = []
+    generations = []
+    nodes_column = []
+    node_counts = []
+    synapse_counts = []
+    
+    for organism in organisms:
+        # Use species ID if available, fallback to tag (looked up once for both)
+        tag = organism.get('genes.tag', 'unknown')
+        species_keys.append(organism.get('genes.speciesID', tag))
+        tags.append(tag)
+        generations.append(organism.get('genes.gen', 0))
+        
+        # Count nodes and synapses (preserving original algorithm)
+        nodes = organism.get('brain.Nodes', [])
+        synapses = organism.get('brain.Synapses', [])
+        node_count = len(nodes) if nodes else 0
+        synapse_count = len(synapses) if synapses else 0
+        
+        nodes_column.append(nodes)
+        node_counts.append(node_count)
+        synapse_counts.append(synapse_count)
+    
+    # Complexity ratio for the whole column at once; map() keeps the per-element
+    # divide in C instead of the loop above (max(..., 1) avoids division by zero)
+    complexity_ratios = list(map(truediv, synapse_counts, map(max, node_counts, repeat(1))))
+    
+    return {
+        'species_key': species_keys,
+        'tag': tags,
+        'generation': generations,
+        'nodes': nodes_column,
+        'node_count': node_counts,
+        'synapse_count': synapse_counts,
+        'complexity': complexity_ratios,
+    }
+
+
+def _focus_pheromone_values(nodes: List, out_name: str, sense_name: str) -> Tuple[float, float]:
+    """Return (emission, detection) for one pheromone color from a brain's nodes.
+    
+    Accepts node dicts or compact (Desc, Value) tuples from compact_brain_nodes().
+    Missing nodes read as 0.0; node descriptions are unique within a brain, so
+    the scan stops once both nodes are found.
+    """
+    emission = 0.0
+    detection = 0.0
+    if not nodes:
+        return emission, detection
+    
+    found_out = found_sense = False
+    if type(nodes[0]) is tuple:
+        for desc, value in nodes:
+            if desc not in PHERO_NAMES:
+                continue
+            if desc == out_name:
+                emission = value
+                found_out = True
+                if found_sense:
+                    break
+            elif desc == sense_name:
+                detection = value
+                found_sense = True
+                if found_out:
+                    break
+    else:
+        # Value is only looked up on the few pheromone nodes
+        for node in nodes:
+            desc = node.get('Desc')
+            if desc not in PHERO_NAMES:
+                continue
+            if desc == out_name:
+                emission = node.get('Value', 0.0)
+                found_out = True
+                if found_sense:
+                    break
+            elif desc == sense_name:
+                detection = node.get('Value', 0.0)
+                found_sense = True
+                if found_out:
+                    break
+    
+    return emission, detection
+
+
+def _mean(values: List[float]) -> float:
+    """Mean of a non-empty list via math.fsum (correctly rounded sum in C)."""
+    return math.fsum(values) / len(values)
+
+
+def _mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """Mean and sample standard deviation of a non-empty list in one pass.
+    
+    Uses Welford's online update, which stays numerically stable without a
+    separate mean pass; the standard deviation is 0.0 for a single value.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    return mean, math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
 
 def calculate_basic_stats(values: List[float]) -> Dict[str, float]:
     """Calculate basic statistical measures for a list of values."""
     if not values:
         return {}
     
+    # statistics.mean/stdev go through exact fractions per element; a single
+    # Welford pass matches them to within rounding at a fraction of the cost
+    mean, stdev = _mean_stdev(values)
+    
     return {
-        'mean': statistics.mean(values),
-        'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+        'mean': mean,
+        'stdev': stdev,
         'min': min(values),
         'max': max(values),
         'median': statistics.median(values),
@@ -36,7 +198,34 @@ def calculate_basic_stats(values: List[float]) -> Dict[str, float]:
     }
 
 
-def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red") -> Dict:
+def _pheromone_species_stats(species_key: Any, columns: Tuple, include_values: bool = False) -> Dict:
+    """Per-species pheromone statistics for analyze_pheromone_patterns()."""
+    # Tag is taken from the first organism; all should have the same tag
+    tag, focus_emissions, focus_detections, generations = columns
+    
+    # Calculate emission/detection statistics for focus color
+    species_stats = {
+        'species_id': str(species_key),  # Ensure string key for JSON compatibility
+        'tag': tag,
+        'organism_count': len(focus_emissions),
+        'generation_range': (min(generations), max(generations)),
+        'emission_stats': {
+            'avg': _mean(focus_emissions),
+            'max': max(focus_emissions)
+        },
+        'detection_stats': {
+            'avg': _mean(focus_detections)
+        }
+    }
+    if include_values:
+        species_stats['emission_stats']['values'] = focus_emissions
+        species_stats['detection_stats']['values'] = focus_detections
+    return species_stats
+
+
+def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red",
+                               include_values: bool = False,
+                               columns: Optional[Dict[str, List]] = None) -> Dict:
     """
     Analyze pheromone emission and detection patterns across organisms.
     
@@ -47,6 +236,9 @@ def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red")
     Args:
         organisms: List of organism dictionaries with neural data
         focus_color: Pheromone color to focus analysis on ("red", "green", "blue")
+        include_values: If True, keep each species' raw per-organism emission and
+            detection lists under 'values' (omitted by default to keep results small)
+        columns: Optional build_behavioral_columns() result for the same organisms
         
     Returns:
         Dict containing pheromone analysis results by species
@@ -63,47 +255,32 @@ def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red")
     
     focus_idx = color_map[focus_color]
     
-    species_pheromone = defaultdict(list)
+    # Only the focus color's nodes are read, so resolve their names once
+    focus_out_name = f'PhereOut{focus_idx}'
+    focus_sense_name = f'PheroSense{focus_idx}'
     
-    for organism in organisms:
-        # Use species ID if available, fallback to tag
-        species_key = organism.get('genes.speciesID', organism.get('genes.tag', 'unknown'))
-        tag = organism.get('genes.tag', 'unknown')
-        generation = organism.get('genes.gen', 0)
-        
-        # Extract pheromone-related nodes from neural data
-        nodes = organism.get('brain.Nodes', [])
-        
-        pheromone_data = {
-            'tag': tag,
-            'generation': generation,
-            'phero_out_1': 0.0,  # Red pheromone emission
-            'phero_out_2': 0.0,  # Green pheromone emission
-            'phero_out_3': 0.0,  # Blue pheromone emission
-            'phero_sense_1': 0.0,  # Red pheromone detection
-            'phero_sense_2': 0.0,  # Green pheromone detection  
-            'phero_sense_3': 0.0,  # Blue pheromone detection
-        }
-        
-        # Extract pheromone node values (preserving original algorithm)
-        for node in nodes:
-            desc = node.get('Desc', '')
-            value = node.get('Value', 0.0)
-            
-            if desc == 'PhereOut1':  # Red pheromone output
-                pheromone_data['phero_out_1'] = value
-            elif desc == 'PhereOut2':  # Green pheromone output
-                pheromone_data['phero_out_2'] = value
-            elif desc == 'PhereOut3':  # Blue pheromone output
-                pheromone_data['phero_out_3'] = value
-            elif desc == 'PheroSense1':  # Red pheromone detection
-                pheromone_data['phero_sense_1'] = value
-            elif desc == 'PheroSense2':  # Green pheromone detection
-                pheromone_data['phero_sense_2'] = value
-            elif desc == 'PheroSense3':  # Blue pheromone detection
-                pheromone_data['phero_sense_3'] = value
+    if columns is None:
+        columns = build_behavioral_columns(organisms)
+    
+    # species_key -> (tag, emissions, detections, generations): one column list
+    # per metric instead of a record per organism
+    species_pheromone = {}
+    all_emissions = []
+    all_detections = []
+    
+    for species_key, tag, generation, nodes in zip(columns['species_key'], columns['tag'],
+                                                   columns['generation'], columns['nodes']):
+        # Extract focus-color node values (missing nodes read as 0.0)
+        emission, detection = _focus_pheromone_values(nodes, focus_out_name, focus_sense_name)
         
-        species_pheromone[species_key].append(pheromone_data)
+        bucket = species_pheromone.get(species_key)
+        if bucket is None:
+            bucket = species_pheromone[species_key] = (tag, [], [], [])
+        bucket[1].append(emission)
+        bucket[2].append(detection)
+        bucket[3].append(generation)
+        all_emissions.append(emission)
+        all_detections.append(detection)
     
     # Analyze patterns by species (preserving core algorithm)
     analysis_results = {
@@ -114,62 +291,38 @@ def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red")
         'summary_stats': {}
     }
     
-    for species_key in sorted(species_pheromone.keys()):
-        organisms_data = species_pheromone[species_key]
-        tag = organisms_data[0]['tag']  # All should have same tag
-        
-        # Calculate emission/detection statistics for focus color
-        focus_emissions = [o[f'phero_out_{focus_idx}'] for o in organisms_data]
-        focus_detections = [o[f'phero_sense_{focus_idx}'] for o in organisms_data]
-        generations = [o['generation'] for o in organisms_data]
+    for species_key, cols in species_pheromone.items():
+        species_stats = _pheromone_species_stats(species_key, cols, include_values=include_values)
+        species_id = species_stats['species_id']
+        analysis_results['species_analysis'][species_id] = species_stats
         
-        avg_emission = statistics.mean(focus_emissions)
-        max_emission = max(focus_emissions)
-        avg_detection = statistics.mean(focus_detections)
-        
-        species_stats = {
-            'species_id': str(species_key),  # Ensure string key for JSON compatibility
-            'tag': tag,
-            'organism_count': len(organisms_data),
-            'generation_range': (min(generations), max(generations)),
-            'emission_stats': {
-                'avg': avg_emission,
-                'max': max_emission,
-                'values': focus_emissions
-            },
-            'detection_stats': {
-                'avg': avg_detection,
-                'values': focus_detections
-            }
-        }
-        
-        analysis_results['species_analysis'][str(species_key)] = species_stats
+        tag = species_stats['tag']
+        organism_count = species_stats['organism_count']
+        avg_emission = species_stats['emission_stats']['avg']
+        max_emission = species_stats['emission_stats']['max']
+        avg_detection = species_stats['detection_stats']['avg']
         
         # Identify significant emitters (threshold from original algorithm)
         if max_emission > 0.1:
             analysis_results['emitters'].append({
-                'species': str(species_key),  # Ensure string for JSON compatibility
+                'species': species_id,
                 'tag': tag,
                 'avg_emission': avg_emission,
                 'max_emission': max_emission,
-                'count': len(organisms_data)
+                'count': organism_count
             })
         
         # Identify significant detectors
         if avg_detection > 0.1:
             analysis_results['detectors'].append({
-                'species': str(species_key),  # Ensure string for JSON compatibility
+                'species': species_id,
                 'tag': tag,
                 'avg_detection': avg_detection,
-                'count': len(organisms_data)
+                'count': organism_count
             })
     
-    # Calculate summary statistics
-    all_emissions = [e for species_data in species_pheromone.values() 
-                    for e in [o[f'phero_out_{focus_idx}'] for o in species_data]]
-    all_detections = [d for species_data in species_pheromone.values() 
-                     for d in [o[f'phero_sense_{focus_idx}'] for o in species_data]]
-    
+    # Calculate summary statistics (all_emissions/all_detections were collected
+    # during the organism pass)
     analysis_results['summary_stats'] = {
         'total_organisms': len(organisms),
         'species_count': len(species_pheromone),
@@ -182,7 +335,42 @@ def analyze_pheromone_patterns(organisms: List[Dict], focus_color: str = "red")
     return analysis_results
 
 
-def calculate_neural_complexity(organisms: List[Dict]) -> Dict:
+def _neural_species_stats(species_key: Any, columns: Tuple, include_values: bool = False) -> Dict:
+    """Per-species neural complexity statistics for calculate_neural_complexity()."""
+    # Tag is taken from the first organism; all should have the same tag
+    tag, generations, node_counts, synapse_counts, complexity_ratios = columns
+    
+    # Calculate statistics (preserving original format)
+    mean_nodes, stdev_nodes = _mean_stdev(node_counts)
+    mean_synapses, stdev_synapses = _mean_stdev(synapse_counts)
+    mean_complexity, stdev_complexity = _mean_stdev(complexity_ratios)
+    species_stats = {
+        'species_id': str(species_key),  # Ensure string key for JSON compatibility
+        'tag': tag,
+        'organism_count': len(node_counts),
+        'generation_range': (min(generations), max(generations)),
+        'nodes': {
+            'mean': mean_nodes,
+            'stdev': stdev_nodes
+        },
+        'synapses': {
+            'mean': mean_synapses,
+            'stdev': stdev_synapses
+        },
+        'complexity': {
+            'mean': mean_complexity,
+            'stdev': stdev_complexity
+        }
+    }
+    if include_values:
+        species_stats['nodes']['values'] = node_counts
+        species_stats['synapses']['values'] = synapse_counts
+        species_stats['complexity']['values'] = complexity_ratios
+    return species_stats
+
+
+def calculate_neural_complexity(organisms: List[Dict], include_values: bool = False,
+                                columns: Optional[Dict[str, List]] = None) -> Dict:
     """
     Calculate neural complexity metrics for organisms.
     
@@ -191,32 +379,34 @@ def calculate_neural_complexity(organisms: List[Dict]) -> Dict:
     
     Args:
         organisms: List of organism dictionaries with neural data
+        include_values: If True, keep each species' raw per-organism node, synapse
+            and complexity lists under 'values' (omitted by default to keep results small)
+        columns: Optional build_behavioral_columns() result for the same organisms
         
     Returns:
         Dict containing neural complexity analysis by species
     """
-    species_neural = defaultdict(list)
-    
-    for organism in organisms:
-        # Use species ID if available, fallback to tag
-        species_key = organism.get('genes.speciesID', organism.get('genes.tag', 'unknown'))
-        tag = organism.get('genes.tag', 'unknown')
-        generation = organism.get('genes.gen', 0)
-        
-        # Count nodes and synapses (preserving original algorithm)
-        nodes = organism.get('brain.Nodes', [])
-        synapses = organism.get('brain.Synapses', [])
-        
-        node_count = len(nodes) if nodes else 0
-        synapse_count = len(synapses) if synapses else 0
-        
-        species_neural[species_key].append({
-            'tag': tag,
-            'generation': generation,
-            'node_count': node_count,
-            'synapse_count': synapse_count,
-            'complexity_ratio': synapse_count / max(node_count, 1)  # Avoid division by zero
-        })
+    if columns is None:
+        columns = build_behavioral_columns(organisms)
+    
+    # species_key -> (tag, generations, node_counts, synapse_counts, complexity_ratios)
+    species_neural = {}
+    
+    for species_key, tag, generation, node_count, synapse_count, complexity_ratio in zip(
+            columns['species_key'], columns['tag'], columns['generation'],
+            columns['node_count'], columns['synapse_count'], columns['complexity']):
+        bucket = species_neural.get(species_key)
+        if bucket is None:
+            bucket = species_neural[species_key] = (tag, [], [], [], [])
+        bucket[1].append(generation)
+        bucket[2].append(node_count)
+        bucket[3].append(synapse_count)
+        bucket[4].append(complexity_ratio)
+    
+    # Ecosystem-wide summary inputs are the columns themselves
+    all_nodes = columns['node_count']
+    all_synapses = columns['synapse_count']
+    all_complexity = columns['complexity']
     
     # Analyze by species (preserving core algorithm)
     analysis_results = {
@@ -225,61 +415,18 @@ def calculate_neural_complexity(organisms: List[Dict]) -> Dict:
         'summary_stats': {}
     }
     
-    for species_key in sorted(species_neural.keys()):
-        organisms_data = species_neural[species_key]
-        tag = organisms_data[0]['tag']  # All should have same tag
-        
-        node_counts = [o['node_count'] for o in organisms_data]
-        synapse_counts = [o['synapse_count'] for o in organisms_data]
-        complexity_ratios = [o['complexity_ratio'] for o in organisms_data]
-        generations = [o['generation'] for o in organisms_data]
-        
-        # Calculate statistics (preserving original format)
-        species_stats = {
-            'species_id': str(species_key),  # Ensure string key for JSON compatibility
-            'tag': tag,
-            'organism_count': len(organisms_data),
-            'generation_range': (min(generations), max(generations)),
-            'nodes': {
-                'mean': statistics.mean(node_counts),
-                'stdev': statistics.stdev(node_counts) if len(node_counts) > 1 else 0,
-                'values': node_counts
-            },
-            'synapses': {
-                'mean': statistics.mean(synapse_counts),
-                'stdev': statistics.stdev(synapse_counts) if len(synapse_counts) > 1 else 0,
-                'values': synapse_counts
-            },
-            'complexity': {
-                'mean': statistics.mean(complexity_ratios),
-                'stdev': statistics.stdev(complexity_ratios) if len(complexity_ratios) > 1 else 0,
-                'values': complexity_ratios
-            }
-        }
-        
-        analysis_results['species_analysis'][str(species_key)] = species_stats
-        
-        # Add to complexity rankings
-        analysis_results['complexity_rankings'].append({
-            'species': str(species_key),  # Ensure string for JSON compatibility
-            'tag': tag,
-            'avg_complexity': species_stats['complexity']['mean'],
-            'avg_nodes': species_stats['nodes']['mean'],
-            'avg_synapses': species_stats['synapses']['mean'],
-            'count': len(organisms_data)
-        })
+    # Rankings are (species_id, avg_complexity) pairs; details live in species_analysis
+    complexity_rankings = analysis_results['complexity_rankings']
+    for species_key, cols in species_neural.items():
+        species_stats = _neural_species_stats(species_key, cols, include_values=include_values)
+        species_id = species_stats['species_id']
+        analysis_results['species_analysis'][species_id] = species_stats
+        complexity_rankings.append((species_id, species_stats['complexity']['mean']))
     
     # Sort rankings by complexity ratio
-    analysis_results['complexity_rankings'].sort(key=lambda x: x['avg_complexity'], reverse=True)
+    complexity_rankings.sort(key=itemgetter(1), reverse=True)
     
     # Calculate ecosystem-wide summary
-    all_nodes = [n for species_data in species_neural.values() 
-                for n in [o['node_count'] for o in species_data]]
-    all_synapses = [s for species_data in species_neural.values() 
-                   for s in [o['synapse_count'] for o in species_data]]
-    all_complexity = [c for species_data in species_neural.values() 
-                     for c in [o['complexity_ratio'] for o in species_data]]
-    
     analysis_results['summary_stats'] = {
         'total_organisms': len(organisms),
         'species_count': len(species_neural),
@@ -291,7 +438,81 @@ def calculate_neural_complexity(organisms: List[Dict]) -> Dict:
     return analysis_results
 
 
-def classify_behavioral_strategies(organisms: List[Dict]) -> Dict:
+def _species_metrics(columns: Dict[str, List]) -> Dict[str, Tuple[float, float, float, float, str, int]]:
+    """Collect the per-species metrics used by strategy classification in one pass.
+    
+    Fuses the parts of analyze_pheromone_patterns() (red pheromone) and
+    calculate_neural_complexity() that classify_behavioral_strategies() needs,
+    without building their full per-species result dicts.
+    
+    Args:
+        columns: build_behavioral_columns() result for the organisms
+        
+    Returns:
+        Dict mapping species key (as string, in first-seen order) to
+        (max_emission, avg_detection, avg_complexity, avg_nodes, tag, count)
+    """
+    # species_key -> [max_emission, detections, complexity_ratios, node_total, tag]
+    accumulators = {}
+    
+    for species_key, tag, nodes, node_count, complexity_ratio in zip(
+            columns['species_key'], columns['tag'], columns['nodes'],
+            columns['node_count'], columns['complexity']):
+        # Red pheromone node values
+        emission, detection = _focus_pheromone_values(nodes, 'PhereOut1', 'PheroSense1')
+        
+        acc = accumulators.get(species_key)
+        if acc is None:
+            acc = accumulators[species_key] = [emission, [], [], 0, tag]
+        elif emission > acc[0]:
+            acc[0] = emission
+        acc[1].append(detection)
+        acc[2].append(complexity_ratio)
+        acc[3] += node_count
+    
+    metrics = {}
+    for species_key, (max_emission, detections, complexity_ratios, node_total, tag) in accumulators.items():
+        count = len(detections)
+        metrics[str(species_key)] = (
+            max_emission,
+            _mean(detections),
+            _mean(complexity_ratios),
+            node_total / count,
+            tag,
+            count,
+        )
+    
+    return metrics
+
+
+def _species_metrics_from_results(pheromone_analysis: Dict,
+                                  neural_analysis: Dict) -> Dict[str, Tuple[float, float, float, float, str, int]]:
+    """Read the classification metrics out of already computed analyzer results.
+    
+    Same shape as _species_metrics(); species missing from the neural results
+    are skipped.
+    """
+    neural_species = neural_analysis['species_analysis']
+    metrics = {}
+    for species_key, phero_data in pheromone_analysis['species_analysis'].items():
+        neural_data = neural_species.get(species_key)
+        if not neural_data:
+            continue
+        metrics[species_key] = (
+            phero_data['emission_stats']['max'],
+            phero_data['detection_stats']['avg'],
+            neural_data['complexity']['mean'],
+            neural_data['nodes']['mean'],
+            phero_data['tag'],
+            phero_data['organism_count'],
+        )
+    return metrics
+
+
+def classify_behavioral_strategies(organisms: List[Dict],
+                                   pheromone_analysis: Optional[Dict] = None,
+                                   neural_analysis: Optional[Dict] = None,
+                                   columns: Optional[Dict[str, List]] = None) -> Dict:
     """
     Classify organisms into behavioral strategy categories based on 
     neural architecture and pheromone patterns.
@@ -301,13 +522,24 @@ def classify_behavioral_strategies(organisms: List[Dict]) -> Dict:
     
     Args:
         organisms: List of organism dictionaries with complete data
+        pheromone_analysis: Optional red-focus result of analyze_pheromone_patterns()
+            for the same organisms, reused instead of re-scanning them
+        neural_analysis: Optional result of calculate_neural_complexity() for the
+            same organisms, reused instead of re-scanning them
+        columns: Optional build_behavioral_columns() result for the same organisms
         
     Returns:
         Dict containing behavioral strategy classification
     """
-    # Get pheromone and neural analysis
-    pheromone_analysis = analyze_pheromone_patterns(organisms, focus_color="red")
-    neural_analysis = calculate_neural_complexity(organisms)
+    if (pheromone_analysis is not None and neural_analysis is not None
+            and pheromone_analysis.get('focus_color') == 'red'):
+        # Caller already ran both analyzers: reuse their per-species stats
+        species_metrics = _species_metrics_from_results(pheromone_analysis, neural_analysis)
+    else:
+        # Single fused pass over the organisms instead of running both analyzers
+        if columns is None:
+            columns = build_behavioral_columns(organisms)
+        species_metrics = _species_metrics(columns)
     
     strategies = {
         'communicators': [],      # High pheromone emission/detection
@@ -317,30 +549,23 @@ def classify_behavioral_strategies(organisms: List[Dict]) -> Dict:
         'generalists': []         # Moderate in multiple domains
     }
     
-    # Classify each species by combining analyses
-    for species_key in pheromone_analysis['species_analysis']:
-        phero_data = pheromone_analysis['species_analysis'][species_key]
-        neural_data = neural_analysis['species_analysis'].get(species_key, {})
-        
-        if not neural_data:
-            continue
-            
-        # Extract key metrics
-        max_emission = phero_data['emission_stats']['max']
-        avg_detection = phero_data['detection_stats']['avg']
-        avg_complexity = neural_data['complexity']['mean']
-        avg_nodes = neural_data['nodes']['mean']
-        
+    summary_accum = {strategy_name: {'species': [], 'sum_communication': 0.0, 'sum_complexity': 0.0}
+                     for strategy_name in strategies}
+    
+    # Classify each species by combining pheromone and neural metrics
+    for species_key, (max_emission, avg_detection, avg_complexity, avg_nodes, tag, count) in species_metrics.items():
         # Classification logic
         is_high_communicator = max_emission > 0.1 or avg_detection > 0.1
         is_complex_brain = avg_complexity > 2.0 or avg_nodes > 20
         
+        communication_score = max(max_emission, avg_detection)
         species_profile = {
             'species': species_key,
-            'tag': phero_data['tag'],
-            'count': phero_data['organism_count'],
-            'communication_score': max(max_emission, avg_detection),
+            'tag': tag,
+            'count': count,
+            'communication_score': communication_score,
             'complexity_score': avg_complexity,
+            'sort_score': communication_score + avg_complexity,  # Display ordering
             'node_count': avg_nodes,
             'classification_factors': {
                 'high_communicator': is_high_communicator,
@@ -353,30 +578,38 @@ def classify_behavioral_strategies(organisms: List[Dict]) -> Dict:
         
         # Assign to behavioral strategy category
         if is_high_communicator and is_complex_brain:
-            strategies['generalists'].append(species_profile)
+            strategy_name = 'generalists'
         elif is_high_communicator and not is_complex_brain:
-            strategies['communicators'].append(species_profile)
+            strategy_name = 'communicators'
         elif not is_high_communicator and is_complex_brain:
-            strategies['complex_thinkers'].append(species_profile)
+            strategy_name = 'complex_thinkers'
         elif max_emission > 0.05 or avg_detection > 0.05 or avg_complexity > 1.5:
-            strategies['specialists'].append(species_profile)
+            strategy_name = 'specialists'
         else:
-            strategies['simple_survivors'].append(species_profile)
+            strategy_name = 'simple_survivors'
+        strategies[strategy_name].append(species_profile)
+        
+        # Accumulate the strategy summary as species are assigned
+        acc = summary_accum[strategy_name]
+        acc['species'].append(species_key)
+        acc['sum_communication'] += communication_score
+        acc['sum_complexity'] += avg_complexity
     
     # Add strategy summaries
     strategy_summary = {}
-    for strategy_name, species_list in strategies.items():
+    for strategy_name, acc in summary_accum.items():
+        count = len(acc['species'])
         strategy_summary[strategy_name] = {
-            'count': len(species_list),
-            'species': [s['species'] for s in species_list],
-            'avg_communication': statistics.mean([s['communication_score'] for s in species_list]) if species_list else 0,
-            'avg_complexity': statistics.mean([s['complexity_score'] for s in species_list]) if species_list else 0
+            'count': count,
+            'species': acc['species'],
+            'avg_communication': acc['sum_communication'] / count if count else 0,
+            'avg_complexity': acc['sum_complexity'] / count if count else 0
         }
     
     return {
         'strategies': strategies,
         'strategy_summary': strategy_summary,
-        'total_species': len(pheromone_analysis['species_analysis']),
+        'total_species': len(species_metrics),
         'classification_criteria': {
             'high_communication_threshold': 0.1,
             'complex_brain_threshold': 2.0,
@@ -385,6 +618,14 @@ def classify_behavioral_strategies(organisms: List[Dict]) -> Dict:
     }
 
 
+def _species_sort_key(species_id: str) -> Tuple[int, int, str]:
+    """Display sort key: numeric species IDs in numeric order, then other keys."""
+    try:
+        return (0, int(species_id), '')
+    except ValueError:
+        return (1, 0, species_id)
+
+
 def display_behavioral_analysis_results(results_dict: Dict, analysis_type: str) -> None:
     """
     Display behavioral analysis results in rich formatted tables.
@@ -403,6 +644,15 @@ def display_behavioral_analysis_results(results_dict: Dict, analysis_type: str)
         console.print(f"[red]Unknown analysis type: {analysis_type}[/red]")
 
 
+def _pheromone_status(species_data: Dict) -> str:
+    """Status cell for the pheromone table (thresholds from original algorithm)."""
+    if species_data['emission_stats']['max'] > 0.1:
+        return "[red]EMITTER[/red]"
+    if species_data['detection_stats']['avg'] > 0.1:
+        return "[yellow]DETECTOR[/yellow]"
+    return "Normal"
+
+
 def _display_pheromone_results(results: Dict) -> None:
     """Display pheromone analysis results."""
     console.print(f"\n[bold blue]🔴 {results['focus_color'].upper()} PHEROMONE ANALYSIS[/bold blue]")
@@ -418,26 +668,21 @@ def _display_pheromone_results(results: Dict) -> None:
     table.add_column("Avg Detection", justify="right")
     table.add_column("Status")
     
-    for species_data in results['species_analysis'].values():
-        avg_emission = species_data['emission_stats']['avg']
-        max_emission = species_data['emission_stats']['max']
-        avg_detection = species_data['detection_stats']['avg']
-        
-        status = "Normal"
-        if max_emission > 0.1:
-            status = "[red]EMITTER[/red]"
-        elif avg_detection > 0.1:
-            status = "[yellow]DETECTOR[/yellow]"
-        
-        table.add_row(
+    species_rows = sorted(results['species_analysis'].values(), key=lambda d: _species_sort_key(d['species_id']))
+    rows = [
+        (
             str(species_data['species_id']),
             species_data['tag'],
             str(species_data['organism_count']),
-            f"{avg_emission:.3f}",
-            f"{max_emission:.3f}",
-            f"{avg_detection:.3f}",
-            status
+            f"{species_data['emission_stats']['avg']:.3f}",
+            f"{species_data['emission_stats']['max']:.3f}",
+            f"{species_data['detection_stats']['avg']:.3f}",
+            _pheromone_status(species_data)
         )
+        for species_data in species_rows
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
@@ -462,15 +707,17 @@ def _display_neural_results(results: Dict) -> None:
     table.add_column("Avg Synapses", justify="right")
     table.add_column("Complexity Ratio", justify="right")
     
-    for i, species in enumerate(results['complexity_rankings'], 1):
+    species_analysis = results['species_analysis']
+    for i, (species_id, avg_complexity) in enumerate(results['complexity_rankings'], 1):
+        species = species_analysis[species_id]
         table.add_row(
             str(i),
-            str(species['species']),
+            species_id,
             species['tag'],
-            str(species['count']),
-            f"{species['avg_nodes']:.1f}",
-            f"{species['avg_synapses']:.1f}",
-            f"{species['avg_complexity']:.2f}"
+            str(species['organism_count']),
+            f"{species['nodes']['mean']:.1f}",
+            f"{species['synapses']['mean']:.1f}",
+            f"{avg_complexity:.2f}"
         )
     
     console.print(table)
@@ -494,7 +741,7 @@ def _display_strategy_results(results: Dict) -> None:
             console.print(f"\n[bold]{strategy_name.replace('_', ' ').title()}:[/bold] {summary['count']} species")
             console.print(f"  Avg Communication: {summary['avg_communication']:.3f}")
             console.print(f"  Avg Complexity: {summary['avg_complexity']:.2f}")
-            console.print(f"  Species: {', '.join(map(str, summary['species']))}")
+            console.print(f"  Species: {', '.join(sorted(map(str, summary['species']), key=_species_sort_key))}")
     
     # Detailed species table
     table = Table(title="Species Behavioral Classification")
@@ -505,16 +752,15 @@ def _display_strategy_results(results: Dict) -> None:
     table.add_column("Complexity", justify="right")
     table.add_column("Nodes", justify="right")
     
-    all_species = []
-    for strategy_name, species_list in results['strategies'].items():
-        for species in species_list:
-            all_species.append((strategy_name, species))
+    all_species = [(strategy_name, species)
+                   for strategy_name, species_list in results['strategies'].items()
+                   for species in species_list]
     
     # Sort by communication score + complexity score for interesting insights
-    all_species.sort(key=lambda x: x[1]['communication_score'] + x[1]['complexity_score'], reverse=True)
+    all_species.sort(key=lambda x: x[1]['sort_score'], reverse=True)
     
-    for strategy_name, species in all_species:
-        table.add_row(
+    rows = [
+        (
             str(species['species']),
             species['tag'],
             strategy_name.replace('_', ' ').title(),
@@ -522,6 +768,10 @@ def _display_strategy_results(results: Dict) -> None:
             f"{species['complexity_score']:.2f}",
             f"{species['node_count']:.1f}"
         )
+        for strategy_name, species in all_species
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
@@ -12,27 +12,15 @@ This module provides high-level analysis runners that coordinate the existing
 specialized analysis modules.
 """
 
+import functools
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from rich.console import Console
 
-# Import analysis modules from extract_data.py  
-from .field_extraction import process_batch_files, extract_species_field
-from .population_analysis import generate_species_summary
-from .spatial_analysis import generate_spatial_analysis
-from .comparison_tools import compare_cycle_directories, compare_specific_species
-from .combat_analysis import run_combat_analysis_from_directory
-from .behavioral_analysis import (
-    analyze_pheromone_patterns, calculate_neural_complexity, 
-    classify_behavioral_strategies, display_behavioral_analysis_results
-)
-from .output_formatters import display_table, display_json, display_csv, save_json_output
-
-# Import metadata extraction from extract_metadata.py
-from ..extract_metadata import extract_metadata_from_save, display_metadata_results, MetadataExtractionError
-
-# Import data access functions
-from .bibites_data import get_zip_file_from_data_path, BibitesDataError
+# The analysis modules (field extraction, population, spatial, comparison,
+# combat, behavioral, output formatting), metadata extraction and data access
+# are imported inside the runners that use them, so a CLI invocation only
+# loads the analyses it actually runs.
 
 console = Console()
 
@@ -40,31 +28,110 @@ class BibitesAnalysisError(Exception):
     """Raised when analysis operation fails."""
     pass
 
-def run_population_analysis(data_paths: List[Path], output: Optional[Path], 
-                           by_species: bool, quick_mode: bool = True) -> None:
-    """Run population/species summary analysis."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Population analysis requires exactly one dataset (use --latest or --name)")
+# Runners that only print parse errors keep at most this many messages
+MAX_ERRORS_KEPT = 1000
+
+def _single_bibites_dir(analysis_name: str):
+    """Decorator for runners that operate on one dataset's bibites directory.
     
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+    The decorated function is called as fn(data_paths, ...) and receives the
+    validated bibites directory in place of data_paths.
     
-    generate_species_summary(bibites_dir, output, quick_mode=quick_mode, use_species_id=by_species)
+    Args:
+        analysis_name: Name used in the "requires exactly one dataset" error
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(data_paths: List[Path], *args, **kwargs):
+            if len(data_paths) != 1:
+                raise BibitesAnalysisError(f"{analysis_name} requires exactly one dataset (use --latest or --name)")
+            
+            bibites_dir = data_paths[0] / 'bibites'
+            if not bibites_dir.is_dir():
+                raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+            
+            return fn(bibites_dir, *args, **kwargs)
+        return wrapper
+    return decorator
 
-def run_spatial_analysis(data_paths: List[Path], output: Optional[Path]) -> None:
-    """Run spatial distribution analysis."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Spatial analysis requires exactly one dataset (use --latest or --name)")
+def _analysis_fields() -> Dict[str, List[str]]:
+    """Fields each single-dataset analysis reads, for load_combined_records()."""
+    from .population_analysis import QUICK_POPULATION_FIELDS, SPECIES_SUMMARY_FIELDS
+    from .spatial_analysis import SPATIAL_FIELDS
+    from .combat_analysis import COMBAT_FIELDS
+    return {
+        'population': QUICK_POPULATION_FIELDS,
+        'species': SPECIES_SUMMARY_FIELDS,
+        'spatial': SPATIAL_FIELDS,
+        'combat': COMBAT_FIELDS,
+    }
+
+@_single_bibites_dir("Combined analysis")
+def load_combined_records(bibites_dir: Path, analyses: List[str],
+                          workers: Optional[int] = None,
+                          batch_size: Optional[int] = None) -> Tuple[List[Dict], List[str]]:
+    """Parse a dataset once for several single-dataset analyses.
+    
+    Extracts the union of the fields the named analyses read (see
+    _analysis_fields()), so the result can be passed as records= to each of
+    run_population_analysis, run_spatial_analysis and run_combat_analysis
+    instead of every runner re-parsing the bibites directory.
     
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+    Args:
+        bibites_dir: Dataset bibites directory (callers pass data_paths)
+        analyses: Analyses to extract fields for ('population', 'species',
+            'spatial', 'combat')
+        workers: Worker processes for parsing (see process_batch_files)
+        batch_size: Maximum files per parallel parsing task
+        
+    Returns:
+        Tuple of (records, errors)
+    """
+    analysis_fields = _analysis_fields()
+    field_paths = list(dict.fromkeys(field for analysis in analyses for field in analysis_fields[analysis]))
+    from .field_extraction import process_batch_files, DEFAULT_BATCH_SIZE
     
-    generate_spatial_analysis(bibites_dir, output)
+    try:
+        return process_batch_files(bibites_dir, field_paths, workers=workers,
+                                   batch_size=batch_size or DEFAULT_BATCH_SIZE)
+    except ValueError as e:
+        raise BibitesAnalysisError(f"Combined extraction failed: {e}")
+
+@_single_bibites_dir("Population analysis")
+def run_population_analysis(bibites_dir: Path, output: Optional[Path], 
+                           by_species: bool, quick_mode: bool = True,
+                           records: Optional[Tuple[List[Dict], List[str]]] = None) -> None:
+    """Run population/species summary analysis (from load_combined_records() output if given)."""
+    from .population_analysis import (
+        generate_species_summary, generate_quick_population_summary_from_records,
+        generate_species_summary_from_records
+    )
+    
+    if records is None:
+        generate_species_summary(bibites_dir, output, quick_mode=quick_mode, use_species_id=by_species)
+    elif quick_mode:
+        results, errors = records
+        generate_quick_population_summary_from_records(results, len(errors), output, use_species_id=by_species)
+    else:
+        results, errors = records
+        generate_species_summary_from_records(results, errors, output)
+
+@_single_bibites_dir("Spatial analysis")
+def run_spatial_analysis(bibites_dir: Path, output: Optional[Path],
+                         records: Optional[Tuple[List[Dict], List[str]]] = None) -> None:
+    """Run spatial distribution analysis (from load_combined_records() output if given)."""
+    from .spatial_analysis import generate_spatial_analysis, generate_spatial_analysis_from_records
+    
+    if records is None:
+        generate_spatial_analysis(bibites_dir, output)
+    else:
+        results, errors = records
+        generate_spatial_analysis_from_records(bibites_dir, results, errors, output)
 
 def run_comparison_analysis(data_paths: List[Path], output: Optional[Path]) -> None:
     """Run population comparison between cycles."""
+    from .comparison_tools import compare_cycle_directories
+    
     if len(data_paths) != 2:
         raise BibitesAnalysisError("Comparison analysis requires exactly two datasets (use --last 2)")
     
@@ -81,6 +148,9 @@ def run_comparison_analysis(data_paths: List[Path], output: Optional[Path]) -> N
 
 def run_metadata_analysis(data_paths: List[Path], output_dir: Optional[Path] = None) -> None:
     """Run ecosystem metadata analysis."""
+    from ..extract_metadata import extract_metadata_from_save, display_metadata_results, MetadataExtractionError
+    from .bibites_data import get_zip_file_from_data_path, BibitesDataError
+    
     if len(data_paths) != 1:
         raise BibitesAnalysisError("Metadata analysis requires exactly one dataset (use --latest or --name)")
     
@@ -97,22 +167,23 @@ def run_metadata_analysis(data_paths: List[Path], output_dir: Optional[Path] = N
     except (BibitesDataError, MetadataExtractionError) as e:
         raise BibitesAnalysisError(f"Metadata extraction failed: {e}")
 
-def run_field_extraction(data_paths: List[Path], fields: str, batch: bool, 
-                        output: Optional[Path], format: str) -> None:
-    """Run field extraction analysis."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Field extraction requires exactly one dataset (use --latest or --name)")
-    
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+@_single_bibites_dir("Field extraction")
+def run_field_extraction(bibites_dir: Path, fields: str, batch: bool, 
+                        output: Optional[Path], format: str, workers: Optional[int] = None,
+                        batch_size: Optional[int] = None) -> None:
+    """Run field extraction analysis (BB8 files are parsed across `workers` processes,
+    at most `batch_size` files per task)."""
+    from .output_formatters import display_table, display_json, display_csv, save_json_output
+    from .field_extraction import process_batch_files, DEFAULT_BATCH_SIZE
     
     field_paths = [f.strip() for f in fields.split(',')]
     
     if batch:
         # Batch processing
         try:
-            results, errors = process_batch_files(bibites_dir, field_paths)
+            results, errors = process_batch_files(bibites_dir, field_paths, workers=workers,
+                                                  max_errors_kept=MAX_ERRORS_KEPT,
+                                                  batch_size=batch_size or DEFAULT_BATCH_SIZE)
         except ValueError as e:
             raise BibitesAnalysisError(f"Field extraction failed: {e}")
         
@@ -135,102 +206,121 @@ def run_field_extraction(data_paths: List[Path], fields: str, batch: bool,
     else:
         raise BibitesAnalysisError("Single file field extraction not supported in unified tool. Use --batch for directory processing.")
 
-def run_species_field_extraction(data_paths: List[Path], output: Optional[Path]) -> None:
+@_single_bibites_dir("Species field extraction")
+def run_species_field_extraction(bibites_dir: Path, output: Optional[Path]) -> None:
     """Extract species ID fields for species name mapping."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Species field extraction requires exactly one dataset (use --latest or --name)")
-    
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+    from .field_extraction import extract_species_field
     
     extract_species_field(bibites_dir, output)
 
-def run_species_comparison(data_paths: List[Path], species_a: int, species_b: int, 
+@_single_bibites_dir("Species comparison")
+def run_species_comparison(bibites_dir: Path, species_a: int, species_b: int, 
                           output: Optional[Path]) -> None:
     """Compare two specific species by their sim-generated species ID."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Species comparison requires exactly one dataset (use --latest or --name)")
-    
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+    from .comparison_tools import compare_specific_species
     
     compare_specific_species(bibites_dir, species_a, species_b, output)
 
-def run_combat_analysis(data_paths: List[Path], lineage: Optional[str], 
-                       size_relative: bool, output: Optional[Path]) -> None:
-    """Run comprehensive combat effectiveness analysis."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Combat analysis requires exactly one dataset (use --latest or --name)")
-    
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+@_single_bibites_dir("Combat analysis")
+def run_combat_analysis(bibites_dir: Path, lineage: Optional[str], 
+                       size_relative: bool, output: Optional[Path],
+                       records: Optional[Tuple[List[Dict], List[str]]] = None,
+                       batch_size: Optional[int] = None) -> None:
+    """Run comprehensive combat effectiveness analysis (from load_combined_records() output if given,
+    otherwise parsing at most `batch_size` files per task)."""
+    from .combat_analysis import run_combat_analysis_from_directory, run_combat_analysis_from_records
+    from .field_extraction import DEFAULT_BATCH_SIZE
     
     try:
-        results = run_combat_analysis_from_directory(
-            bibites_dir, 
-            lineage_filter=lineage,
-            size_relative=size_relative,
-            output=output
-        )
+        if records is None:
+            results = run_combat_analysis_from_directory(
+                bibites_dir, 
+                lineage_filter=lineage,
+                size_relative=size_relative,
+                output=output,
+                top_k=5,
+                max_insights=5,
+                batch_size=batch_size or DEFAULT_BATCH_SIZE
+            )
+        else:
+            organisms, errors = records
+            results = run_combat_analysis_from_records(
+                bibites_dir, organisms, errors,
+                lineage_filter=lineage,
+                size_relative=size_relative,
+                output=output,
+                top_k=5,
+                max_insights=5
+            )
         
         # Display key results to console
         if results and 'combat_effectiveness' in results:
             combat_data = results['combat_effectiveness']
             summary = combat_data.get('summary', {})
             
-            console.print(f"\n[green]⚔️ COMBAT EFFECTIVENESS ANALYSIS[/green]")
-            console.print(f"📊 Total organisms: {summary.get('total_organisms', 0)}")
-            console.print(f"⚔️ Active combatants: {summary.get('total_combatants', 0)} ({summary.get('combat_participation_rate', 0):.1f}%)")
-            console.print(f"💀 Successful killers: {summary.get('total_killers', 0)} ({summary.get('kill_rate', 0):.1f}%)")
-            console.print(f"🧬 Mature organisms: {summary.get('mature_combatants', 0)}")
+            # Collect the report and render it with one console.print
+            lines = [
+                f"\n[green]⚔️ COMBAT EFFECTIVENESS ANALYSIS[/green]",
+                f"📊 Total organisms: {summary.get('total_organisms', 0)}",
+                f"⚔️ Active combatants: {summary.get('total_combatants', 0)} ({summary.get('combat_participation_rate', 0):.1f}%)",
+                f"💀 Successful killers: {summary.get('total_killers', 0)} ({summary.get('kill_rate', 0):.1f}%)",
+                f"🧬 Mature organisms: {summary.get('mature_combatants', 0)}",
+            ]
             
-            # Show insights
+            # Show insights (already capped by max_insights)
             insights = combat_data.get('insights', [])
             if insights:
-                console.print(f"\n[blue]💡 KEY INSIGHTS:[/blue]")
-                for insight in insights[:5]:  # Limit to top 5 insights
-                    console.print(f"  {insight}")
+                lines.append(f"\n[blue]💡 KEY INSIGHTS:[/blue]")
+                lines.extend(f"  {insight}" for insight in insights)
             
             # Show top performers
             top_performers = combat_data.get('top_performers', {})
             if top_performers.get('combat_fitness'):
-                console.print(f"\n[yellow]🏆 TOP COMBAT PERFORMERS:[/yellow]")
+                lines.append(f"\n[yellow]🏆 TOP COMBAT PERFORMERS:[/yellow]")
                 for i, performer in enumerate(top_performers['combat_fitness'][:3], 1):
-                    console.print(f"  {i}. {performer['tag']} (Species {performer['species_id']}, Gen {performer['generation']})")
-                    console.print(f"     Combat fitness: {performer['combat_fitness']:.1f}, Size: {performer['size']:.2f}")
-                    console.print(f"     {performer['damage']:.1f} damage, {performer['kills']} kills, {performer['eggs_laid']} eggs")
+                    lines.append(f"  {i}. {performer['tag']} (Species {performer['species_id']}, Gen {performer['generation']})")
+                    lines.append(f"     Combat fitness: {performer['combat_fitness']:.1f}, Size: {performer['size']:.2f}")
+                    lines.append(f"     {performer['damage']:.1f} damage, {performer['kills']} kills, {performer['eggs_laid']} eggs")
+            
+            console.print("\n".join(lines))
         
     except Exception as e:
         raise BibitesAnalysisError(f"Combat analysis failed: {e}")
 
 
-def run_behavioral_analysis(data_paths: List[Path], pheromone_focus: str, 
+@_single_bibites_dir("Behavioral analysis")
+def run_behavioral_analysis(bibites_dir: Path, pheromone_focus: str, 
                            neural_complexity_only: bool, by_species: bool, 
-                           output: Optional[Path]) -> None:
+                           output: Optional[Path], workers: Optional[int] = None,
+                           batch_size: Optional[int] = None) -> None:
     """Run comprehensive behavioral analysis including pheromone patterns and neural complexity."""
-    if len(data_paths) != 1:
-        raise BibitesAnalysisError("Behavioral analysis requires exactly one dataset (use --latest or --name)")
-    
-    bibites_dir = data_paths[0] / 'bibites'
-    if not bibites_dir.exists():
-        raise BibitesAnalysisError(f"Bibites directory not found: {bibites_dir}")
+    from .field_extraction import process_batch_files, DEFAULT_BATCH_SIZE
+    from .behavioral_analysis import (
+        analyze_pheromone_patterns, calculate_neural_complexity, 
+        classify_behavioral_strategies, display_behavioral_analysis_results,
+        compact_brain_nodes, build_behavioral_columns
+    )
+    from .output_formatters import save_json_output
     
     try:
         # Extract the organism data with neural and genetic information
         console.print("[blue]Extracting behavioral data from organisms...[/blue]")
         
-        # We need specific fields for behavioral analysis
+        # We need specific fields for behavioral analysis; neural complexity
+        # only reads the node and synapse lists
         behavioral_fields = [
             'genes.speciesID', 'genes.tag', 'genes.gen',
-            'brain.Nodes', 'brain.Synapses', 'brain.InputNodes', 'brain.OutputNodes'
+            'brain.Nodes', 'brain.Synapses'
         ]
+        if not neural_complexity_only:
+            behavioral_fields += ['brain.InputNodes', 'brain.OutputNodes']
         
         organisms_data, errors = process_batch_files(
             directory_path=bibites_dir,
-            field_paths=behavioral_fields
+            field_paths=behavioral_fields,
+            workers=workers,
+            max_errors_kept=MAX_ERRORS_KEPT,
+            batch_size=batch_size or DEFAULT_BATCH_SIZE
         )
         
         if errors:
@@ -242,25 +332,38 @@ def run_behavioral_analysis(data_paths: List[Path], pheromone_focus: str,
         
         console.print(f"[green]Loaded {len(organisms_data)} organisms for behavioral analysis[/green]")
         
+        # Organisms are only used for behavioral analysis here, so compact the
+        # brain nodes once for the pheromone scans and extract the analyzer
+        # fields once for all passes
+        compact_brain_nodes(organisms_data)
+        behavioral_columns = build_behavioral_columns(organisms_data)
+        
         # Initialize results dictionary
         analysis_results = {}
         
         # Run neural complexity analysis (always included)
         console.print("\n[blue]Analyzing neural complexity patterns...[/blue]")
-        neural_results = calculate_neural_complexity(organisms_data)
+        neural_results = calculate_neural_complexity(organisms_data, columns=behavioral_columns)
         analysis_results['neural_complexity'] = neural_results
         display_behavioral_analysis_results(neural_results, "neural")
         
         # Run pheromone analysis (unless neural-only mode)
         if not neural_complexity_only:
             console.print(f"\n[blue]Analyzing {pheromone_focus} pheromone patterns...[/blue]")
-            pheromone_results = analyze_pheromone_patterns(organisms_data, focus_color=pheromone_focus)
+            pheromone_results = analyze_pheromone_patterns(
+                organisms_data, focus_color=pheromone_focus, columns=behavioral_columns
+            )
             analysis_results['pheromone_patterns'] = pheromone_results
             display_behavioral_analysis_results(pheromone_results, "pheromone")
             
             # Run behavioral strategy classification (combines both analyses)
             console.print(f"\n[blue]Classifying behavioral strategies...[/blue]")
-            strategy_results = classify_behavioral_strategies(organisms_data)
+            strategy_results = classify_behavioral_strategies(
+                organisms_data,
+                pheromone_analysis=pheromone_results,
+                neural_analysis=neural_results,
+                columns=behavioral_columns
+            )
             analysis_results['behavioral_strategies'] = strategy_results
             display_behavioral_analysis_results(strategy_results, "strategy")
         
@@ -269,27 +372,32 @@ def run_behavioral_analysis(data_paths: List[Path], pheromone_focus: str,
             console.print(f"\n[blue]Saving behavioral analysis results to {output}[/blue]")
             save_json_output(analysis_results, output)
             
-        # Summary insights
-        console.print(f"\n[bold green]Behavioral Analysis Summary:[/bold green]")
+        # Summary insights, rendered with one console.print
         total_species = neural_results['summary_stats']['species_count']
         total_organisms = neural_results['summary_stats']['total_organisms']
-        console.print(f"  • Analyzed {total_organisms} organisms across {total_species} species")
+        lines = [
+            f"\n[bold green]Behavioral Analysis Summary:[/bold green]",
+            f"  • Analyzed {total_organisms} organisms across {total_species} species",
+        ]
         
         if neural_results['complexity_rankings']:
-            top_complex = neural_results['complexity_rankings'][0]
-            console.print(f"  • Most complex species: {top_complex['tag']} (complexity ratio: {top_complex['avg_complexity']:.2f})")
+            top_species_id, top_complexity = neural_results['complexity_rankings'][0]
+            top_tag = neural_results['species_analysis'][top_species_id]['tag']
+            lines.append(f"  • Most complex species: {top_tag} (complexity ratio: {top_complexity:.2f})")
         
         if not neural_complexity_only and 'pheromone_patterns' in analysis_results:
             phero_summary = analysis_results['pheromone_patterns']['summary_stats']
             emitter_count = phero_summary['emitter_species_count']
             detector_count = phero_summary['detector_species_count']
-            console.print(f"  • {pheromone_focus.capitalize()} pheromone: {emitter_count} emitter species, {detector_count} detector species")
+            lines.append(f"  • {pheromone_focus.capitalize()} pheromone: {emitter_count} emitter species, {detector_count} detector species")
             
             if 'behavioral_strategies' in analysis_results:
                 strategy_summary = analysis_results['behavioral_strategies']['strategy_summary']
                 for strategy_name, info in strategy_summary.items():
                     if info['count'] > 0:
-                        console.print(f"  • {strategy_name.replace('_', ' ').title()}: {info['count']} species")
+                        lines.append(f"  • {strategy_name.replace('_', ' ').title()}: {info['count']} species")
+        
+        console.print("\n".join(lines))
         
     except Exception as e:
         raise BibitesAnalysisError(f"Behavioral analysis failed: {e}")
\ No newline at end of file
@@ -14,11 +14,12 @@ between different ecosystem saves.
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from rich.console import Console
-import json
+import heapq
+import orjson
+from operator import itemgetter
 import zipfile
 import random
 from datetime import datetime
-import shutil
 
 # Import data access functions
 from .bibites_data import (
@@ -29,15 +30,90 @@ from .bibites_data import (
 # Import save access functions
 from ..extract_save import (
     find_save_by_name, get_output_directory, is_directory_cached, 
-    extract_save_files, SaveExtractionError, SAVEFILES_PATH
+    extract_save_files, SaveExtractionError, SAVEFILES_PATH, AUTOSAVES_PATH,
+    is_bb8_file, is_image_file, categorize_bb8_file, member_basename, copy_zip_member
 )
 
 console = Console()
 
+# Deflate level for JSON entries: level 1 packs several times faster than
+# zlib's default 6 and costs little ratio on repetitive .bb8 JSON
+SAVE_ZIP_COMPRESSLEVEL = 1
+
+# Save lookups are memoized for the life of the process, so scripted runs
+# (e.g. retag then inject on the same saves) skip repeated directory scans
+SAVE_LOOKUP_CACHE_SIZE = 32
+_SAVE_LOOKUP_CACHE: Dict[str, Tuple[Path, tuple]] = {}
+_EXTRACTED_DIRS = set()
+
 class BibitesCrossPollinateError(Exception):
     """Raised when cross-pollination operation fails."""
     pass
 
+def _dir_mtime_ns(directory: Path) -> Optional[int]:
+    """Directory mtime in ns, or None if it cannot be stat'ed."""
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _save_dir_stamp(found: Path) -> tuple:
+    """Directory mtimes that can change which save a lookup resolves to.
+    
+    Autosaves are searched first, so an autosave hit only depends on the
+    autosaves directory; saves written to Savefiles (e.g. by these tools)
+    then leave the entry valid.
+    """
+    if found.parent == AUTOSAVES_PATH:
+        return (_dir_mtime_ns(AUTOSAVES_PATH),)
+    return (_dir_mtime_ns(AUTOSAVES_PATH), _dir_mtime_ns(SAVEFILES_PATH))
+
+def _find_save_cached(name_pattern: str) -> Path:
+    """find_save_by_name() memoized on the pattern, checked against save directory mtimes.
+    
+    Adding or removing a save changes its directory's mtime, so new saves are
+    still found. Failed lookups are not cached.
+    """
+    cached = _SAVE_LOOKUP_CACHE.get(name_pattern)
+    if cached is not None and _save_dir_stamp(cached[0]) == cached[1]:
+        return cached[0]
+    found = find_save_by_name(name_pattern)
+    if name_pattern not in _SAVE_LOOKUP_CACHE and len(_SAVE_LOOKUP_CACHE) >= SAVE_LOOKUP_CACHE_SIZE:
+        del _SAVE_LOOKUP_CACHE[next(iter(_SAVE_LOOKUP_CACHE))]
+    _SAVE_LOOKUP_CACHE[name_pattern] = (found, _save_dir_stamp(found))
+    return found
+
+def _ensure_extracted(save_zip: Path, role: str) -> Path:
+    """Return the save's extracted data directory, extracting it first if needed.
+    
+    Only directories known to hold extracted data are remembered, so a
+    directory that was not cached yet is always re-checked.
+    
+    Args:
+        save_zip: Save zip file
+        role: Label for the extraction message (e.g. 'source', 'target')
+    """
+    output_dir = get_output_directory(save_zip)
+    if output_dir not in _EXTRACTED_DIRS:
+        if not is_directory_cached(output_dir):
+            console.print(f"[green]Extracting {role}: {save_zip.name}[/green]")
+            extract_save_files(save_zip, output_dir)
+        _EXTRACTED_DIRS.add(output_dir)
+    return output_dir
+
+def clear_caches() -> None:
+    """Forget memoized save lookups and extracted directories."""
+    _SAVE_LOOKUP_CACHE.clear()
+    _EXTRACTED_DIRS.clear()
+
+# x, y of a transform.position list, fetched in one C-level call
+_position_xy = itemgetter(0, 1)
+
+def _generation(bibite: Dict[str, Any]) -> Any:
+    """Generation number of a bibite (0 if missing), the fitness sort key."""
+    genes = bibite.get('genes')
+    return 0 if genes is None else genes.get('gen', 0)
+
 def get_fittest_bibites(bibites: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
     """Get the fittest bibites based on generation number.
     
@@ -48,13 +124,15 @@ def get_fittest_bibites(bibites: List[Dict[str, Any]], count: int) -> List[Dict[
     Returns:
         List of top fittest bibites (copies of original data)
     """
-    # Sort by generation number (fitness proxy) in descending order
-    sorted_bibites = sorted(bibites, key=lambda b: b.get('genes', {}).get('gen', 0), reverse=True)
+    # Select the top N by generation number (fitness proxy); nlargest is a
+    # partial sort with the same tie order as a stable descending sort
+    top_bibites = heapq.nlargest(count, bibites, key=_generation)
     
-    # Return deep copies of the top N bibites to avoid modifying originals
+    # Return deep copies of the top N bibites to avoid modifying originals;
+    # an orjson round trip stays in C and is much faster than stdlib json
     fittest = []
-    for i in range(min(count, len(sorted_bibites))):
-        fittest.append(json.loads(json.dumps(sorted_bibites[i])))
+    for bibite in top_bibites:
+        fittest.append(orjson.loads(orjson.dumps(bibite)))
     
     return fittest
 
@@ -66,28 +144,43 @@ def randomize_bibite_positions(bibites: List[Dict[str, Any]], bounds: Tuple[floa
         bounds: Tuple of (min_x, max_x, min_y, max_y) coordinates
     """
     min_x, max_x, min_y, max_y = bounds
+    span_x = max_x - min_x
+    span_y = max_y - min_y
     
+    # Same draws as random.uniform (a + (b - a) * random()), without the
+    # per-call method lookup and argument handling
+    rand = random.random
     for bibite in bibites:
-        if 'transform' in bibite and 'position' in bibite['transform']:
-            new_x = random.uniform(min_x, max_x)
-            new_y = random.uniform(min_y, max_y)
-            bibite['transform']['position'] = [new_x, new_y]
+        transform = bibite.get('transform')
+        if transform is not None and 'position' in transform:
+            new_x = min_x + span_x * rand()
+            new_y = min_y + span_y * rand()
+            transform['position'] = [new_x, new_y]
+
+def _compress_type_for(filename: str) -> int:
+    """Store already-compressed PNGs as-is; deflate everything else."""
+    return zipfile.ZIP_STORED if filename.lower().endswith('.png') else zipfile.ZIP_DEFLATED
 
-def create_save_zip(output_path: Path, bibites_dir: Path, eggs_dir: Path, images_dir: Path, source_dir: Path) -> None:
-    """Create a new save zip file from extracted directories including metadata files.
+def create_save_zip(output_path: Path, bibites: List[Dict[str, Any]], source_dir: Path, source_zip: Path) -> None:
+    """Create a new save zip file from in-memory bibites plus another save's eggs, images and metadata.
+    
+    Bibites are serialized straight into the archive, so no temporary
+    bibite files are written and re-read. Eggs and images are streamed from
+    the source save zip, keeping their compression method, under the
+    same names extract_save_files gives them.
     
     Args:
         output_path: Path for the new .zip file
-        bibites_dir: Directory containing bibite .bb8 files
-        eggs_dir: Directory containing egg .bb8 files
-        images_dir: Directory containing image files
-        source_dir: Source directory containing metadata files
+        bibites: List of bibite JSON dictionaries, stored as bibites/bibite_<i>.bb8
+        source_dir: Extracted save directory providing metadata files
+        source_zip: Save zip providing eggs and images
         
     Raises:
         BibitesCrossPollinateError: If save creation fails
     """
     try:
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=SAVE_ZIP_COMPRESSLEVEL) as zf:
             # Add critical metadata files from source directory
             metadata_files = [
                 'settings.bb8settings', 'speciesData.json', 'scene.bb8scene',
@@ -98,32 +191,38 @@ def create_save_zip(output_path: Path, bibites_dir: Path, eggs_dir: Path, images
             for metadata_file in metadata_files:
                 source_file = source_dir / metadata_file
                 if source_file.exists():
-                    zf.write(source_file, metadata_file)
+                    zf.write(source_file, metadata_file, compress_type=_compress_type_for(metadata_file))
                     metadata_count += 1
             
-            # Add bibites
-            bibite_count = 0
-            if bibites_dir.exists():
-                for bb8_file in bibites_dir.glob('*.bb8'):
-                    arcname = f"bibites/{bb8_file.name}"
-                    zf.write(bb8_file, arcname)
-                    bibite_count += 1
+            # Add bibites, serialized straight into the archive; each member is
+            # deflated by writestr at the archive's SAVE_ZIP_COMPRESSLEVEL
+            for i, bibite in enumerate(bibites):
+                zf.writestr(f"bibites/bibite_{i}.bb8", orjson.dumps(bibite))
+            bibite_count = len(bibites)
             
-            # Add eggs
+            # Add eggs and images straight from the source save zip
             egg_count = 0
-            if eggs_dir.exists():
-                for bb8_file in eggs_dir.glob('*.bb8'):
-                    arcname = f"eggs/{bb8_file.name}"
-                    zf.write(bb8_file, arcname)
-                    egg_count += 1
-            
-            # Add images
             image_count = 0
-            if images_dir.exists():
-                for img_file in images_dir.iterdir():
-                    if img_file.is_file():
-                        arcname = f"images/{img_file.name}"
-                        zf.write(img_file, arcname)
+            used_image_names = set()
+            with zipfile.ZipFile(source_zip, 'r') as source:
+                for info in source.infolist():
+                    if is_bb8_file(info.filename):
+                        category, number = categorize_bb8_file(info.filename)
+                        if category != 'egg':
+                            continue
+                        copy_zip_member(source, info, zf, f"eggs/egg_{number}.bb8")
+                        egg_count += 1
+                    elif is_image_file(info.filename):
+                        # Flatten to the basename, suffixing duplicates like extraction does
+                        image_name = member_basename(info.filename)
+                        if image_name in used_image_names:
+                            stem, dot, suffix = image_name.rpartition('.')
+                            counter = 1
+                            while image_name in used_image_names:
+                                image_name = f"{stem}_{counter}{dot}{suffix}"
+                                counter += 1
+                        used_image_names.add(image_name)
+                        copy_zip_member(source, info, zf, f"images/{image_name}")
                         image_count += 1
         
         console.print(f"[green]Successfully created save file: {output_path}[/green]")
@@ -147,24 +246,15 @@ def run_inject_fittest(source_name: str, target_name: str, count: int,
     """
     try:
         # Find source and target saves
-        source_zip = find_save_by_name(source_name)
-        target_zip = find_save_by_name(target_name)
+        source_zip = _find_save_cached(source_name)
+        target_zip = _find_save_cached(target_name)
         
         console.print(f"[blue]Source: {source_zip.name}[/blue]")
         console.print(f"[blue]Target: {target_zip.name}[/blue]")
         
         # Extract source and target data if needed
-        source_dir = get_output_directory(source_zip)
-        target_dir = get_output_directory(target_zip)
-        
-        # Ensure data is extracted
-        if not is_directory_cached(source_dir):
-            console.print(f"[green]Extracting source: {source_zip.name}[/green]")
-            extract_save_files(source_zip, source_dir)
-        
-        if not is_directory_cached(target_dir):
-            console.print(f"[green]Extracting target: {target_zip.name}[/green]")
-            extract_save_files(target_zip, target_dir)
+        source_dir = _ensure_extracted(source_zip, 'source')
+        target_dir = _ensure_extracted(target_zip, 'target')
         
         # Load bibites from source and target
         source_bibites = load_bibites_from_directory(source_dir / 'bibites')
@@ -181,17 +271,23 @@ def run_inject_fittest(source_name: str, target_name: str, count: int,
         
         console.print(f"[green]Selected top {len(fittest)} fittest bibites (generations: {[b['genes']['gen'] for b in fittest]})[/green]")
         
-        # Determine position bounds from target bibites
-        target_positions = []
+        # Determine position bounds from target bibites in a single pass,
+        # without building intermediate position/coordinate lists
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+        found_position = False
         for bibite in target_bibites:
-            if 'transform' in bibite and 'position' in bibite['transform']:
-                pos = bibite['transform']['position']
-                target_positions.append((pos[0], pos[1]))
-        
-        if target_positions:
-            xs = [pos[0] for pos in target_positions]
-            ys = [pos[1] for pos in target_positions]
-            bounds = (min(xs) - 50, max(xs) + 50, min(ys) - 50, max(ys) + 50)
+            transform = bibite.get('transform')
+            if transform is not None and 'position' in transform:
+                x, y = _position_xy(transform['position'])
+                min_x = x if x < min_x else min_x
+                max_x = x if x > max_x else max_x
+                min_y = y if y < min_y else min_y
+                max_y = y if y > max_y else max_y
+                found_position = True
+        
+        if found_position:
+            bounds = (min_x - 50, max_x + 50, min_y - 50, max_y + 50)
         else:
             # Default bounds if no target positions found
             bounds = (-100, 100, -100, 100)
@@ -200,32 +296,9 @@ def run_inject_fittest(source_name: str, target_name: str, count: int,
         randomize_bibite_positions(fittest, bounds)
         console.print(f"[cyan]Randomized positions within bounds: {bounds}[/cyan]")
         
-        # Create temporary directory for combined save
-        temp_dir = Path('./tmp') / f"cross_pollination_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        temp_bibites_dir = temp_dir / 'bibites'
-        temp_eggs_dir = temp_dir / 'eggs'
-        temp_images_dir = temp_dir / 'images'
-        
-        temp_bibites_dir.mkdir(exist_ok=True)
-        temp_eggs_dir.mkdir(exist_ok=True)
-        temp_images_dir.mkdir(exist_ok=True)
-        
-        # Copy target data to temp directory
-        if (target_dir / 'eggs').exists():
-            shutil.copytree(target_dir / 'eggs', temp_eggs_dir, dirs_exist_ok=True)
-        if (target_dir / 'images').exists():
-            shutil.copytree(target_dir / 'images', temp_images_dir, dirs_exist_ok=True)
-        
-        # Write combined bibites (target + injected fittest)
+        # Combined bibites (target + injected fittest)
         combined_bibites = target_bibites + fittest
         
-        for i, bibite in enumerate(combined_bibites):
-            output_file = temp_bibites_dir / f"bibite_{i}.bb8"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(bibite, f, separators=(',', ':'))
-        
         console.print(f"[green]Combined {len(target_bibites)} target + {len(fittest)} injected = {len(combined_bibites)} total bibites[/green]")
         
         # Generate output filename
@@ -238,18 +311,15 @@ def run_inject_fittest(source_name: str, target_name: str, count: int,
         # Create output path in Savefiles directory
         output_path = SAVEFILES_PATH / output_filename
         
-        # Create the new save zip file
-        create_save_zip(output_path, temp_bibites_dir, temp_eggs_dir, temp_images_dir, target_dir)
-        
-        # Clean up temp directory
-        shutil.rmtree(temp_dir)
+        # Create the new save zip file, taking eggs, images and metadata from the target save
+        create_save_zip(output_path, combined_bibites, target_dir, target_zip)
         
         console.print(f"[bold green]Cross-pollination complete![/bold green]")
         console.print(f"[green]Output: {output_path}[/green]")
         console.print(f"[cyan]Added {len(fittest)} evolved predators to {len(target_bibites)} herbivores[/cyan]")
         console.print(f"[cyan]Total organisms: {len(combined_bibites)}[/cyan]")
         
-    except (SaveExtractionError, BibitesDataError, IOError, json.JSONDecodeError) as e:
+    except (SaveExtractionError, BibitesDataError, IOError, orjson.JSONDecodeError, orjson.JSONEncodeError) as e:
         raise BibitesCrossPollinateError(f"Cross-pollination failed: {e}")
 
 def run_retag_bulk(source_name: str, find_tag: str, replace_tag: str, 
@@ -268,7 +338,7 @@ def run_retag_bulk(source_name: str, find_tag: str, replace_tag: str,
     """
     try:
         # Find source save
-        source_zip = find_save_by_name(source_name)
+        source_zip = _find_save_cached(source_name)
         
         console.print(f"[blue]Source: {source_zip.name}[/blue]")
         console.print(f"[blue]Find: '{find_tag}' → Replace: '{replace_tag}'[/blue]")
@@ -276,26 +346,27 @@ def run_retag_bulk(source_name: str, find_tag: str, replace_tag: str,
             console.print(f"[yellow]DRY-RUN MODE: Preview only, no changes will be saved[/yellow]")
         
         # Extract source data if needed
-        source_dir = get_output_directory(source_zip)
-        
-        # Ensure data is extracted
-        if not is_directory_cached(source_dir):
-            console.print(f"[green]Extracting source: {source_zip.name}[/green]")
-            extract_save_files(source_zip, source_dir)
+        source_dir = _ensure_extracted(source_zip, 'source')
         
         # Load bibites from source
         source_bibites = load_bibites_from_directory(source_dir / 'bibites')
         
         console.print(f"[cyan]Found {len(source_bibites)} bibites in source[/cyan]")
         
-        # Find and count matching organisms
-        matching_organisms = []
+        # Find and count matching organisms in one pass, keeping only the first
+        # few for the preview; when applying, retag them in the same pass
+        match_count = 0
+        preview = []
         for i, bibite in enumerate(source_bibites):
-            current_tag = bibite.get('genes', {}).get('tag', '')
-            if current_tag == find_tag:
-                matching_organisms.append((i, bibite))
-        
-        if not matching_organisms:
+            genes = bibite.get('genes')
+            if genes is not None and genes.get('tag', '') == find_tag:
+                match_count += 1
+                if len(preview) < 10:
+                    preview.append((i, genes.get('tag', '<empty>')))
+                if not dry_run:
+                    genes['tag'] = replace_tag
+        
+        if not match_count:
             console.print(f"[red]No organisms found with tag '{find_tag}'[/red]")
             console.print("[blue]Available tags in this save:[/blue]")
             tags = {}
@@ -307,56 +378,28 @@ def run_retag_bulk(source_name: str, find_tag: str, replace_tag: str,
                 console.print(f"  '{tag}': {count} organisms")
             return
         
-        console.print(f"[green]Found {len(matching_organisms)} organisms with tag '{find_tag}'[/green]")
+        console.print(f"[green]Found {match_count} organisms with tag '{find_tag}'[/green]")
         
         # Show preview table
         console.print("\n[bold cyan]Change Preview:[/bold cyan]")
         console.print(f"{'Index':<8} {'Current Tag':<20} {'New Tag':<20}")
         console.print("-" * 50)
-        for i, bibite in matching_organisms[:10]:  # Show first 10 matches
-            current_tag = bibite.get('genes', {}).get('tag', '<empty>')
+        for i, current_tag in preview:  # Show first 10 matches
             console.print(f"{i:<8} {current_tag:<20} {replace_tag:<20}")
         
-        if len(matching_organisms) > 10:
-            console.print(f"... and {len(matching_organisms) - 10} more organisms")
+        if match_count > 10:
+            console.print(f"... and {match_count - 10} more organisms")
         
         if dry_run:
             console.print(f"\n[yellow]Dry-run complete. Use --apply to make actual changes.[/yellow]")
-            console.print(f"[cyan]Would modify {len(matching_organisms)} organisms[/cyan]")
+            console.print(f"[cyan]Would modify {match_count} organisms[/cyan]")
             return
         
-        # Apply changes to bibites
-        changes = 0
-        for i, bibite in matching_organisms:
-            bibite['genes']['tag'] = replace_tag
-            changes += 1
+        # Changes were applied during the scan above
+        changes = match_count
         
         console.print(f"[green]Applied changes to {changes} organisms[/green]")
         
-        # Create temporary directory for modified save
-        temp_dir = Path('./tmp') / f"retag_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        temp_bibites_dir = temp_dir / 'bibites'
-        temp_eggs_dir = temp_dir / 'eggs'
-        temp_images_dir = temp_dir / 'images'
-        
-        temp_bibites_dir.mkdir(exist_ok=True)
-        temp_eggs_dir.mkdir(exist_ok=True)
-        temp_images_dir.mkdir(exist_ok=True)
-        
-        # Copy eggs and images from source
-        if (source_dir / 'eggs').exists():
-            shutil.copytree(source_dir / 'eggs', temp_eggs_dir, dirs_exist_ok=True)
-        if (source_dir / 'images').exists():
-            shutil.copytree(source_dir / 'images', temp_images_dir, dirs_exist_ok=True)
-        
-        # Write modified bibites
-        for i, bibite in enumerate(source_bibites):
-            output_file = temp_bibites_dir / f"bibite_{i}.bb8"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(bibite, f, separators=(',', ':'))
-        
         # Generate output filename
         if output_name:
             output_filename = f"{output_name}.zip"
@@ -369,16 +412,13 @@ def run_retag_bulk(source_name: str, find_tag: str, replace_tag: str,
         # Create output path in Savefiles directory
         output_path = SAVEFILES_PATH / output_filename
         
-        # Create the new save zip file
-        create_save_zip(output_path, temp_bibites_dir, temp_eggs_dir, temp_images_dir, source_dir)
-        
-        # Clean up temp directory
-        shutil.rmtree(temp_dir)
+        # Create the new save zip file, taking eggs, images and metadata from the source save
+        create_save_zip(output_path, source_bibites, source_dir, source_zip)
         
         console.print(f"[bold green]Tag modification complete![/bold green]")
         console.print(f"[green]Output: {output_path}[/green]")
         console.print(f"[cyan]Modified {changes} organisms: '{find_tag}' → '{replace_tag}'[/cyan]")
         console.print(f"[cyan]Total organisms: {len(source_bibites)}[/cyan]")
         
-    except (SaveExtractionError, BibitesDataError, IOError, json.JSONDecodeError) as e:
+    except (SaveExtractionError, BibitesDataError, IOError, orjson.JSONDecodeError, orjson.JSONEncodeError) as e:
         raise BibitesCrossPollinateError(f"Tag modification failed: {e}")
\ No newline at end of file
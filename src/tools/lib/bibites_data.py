@@ -10,26 +10,67 @@ Handles all data access operations including:
 This module provides the foundational data access layer for the unified bibites tool.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from rich.console import Console
 from rich.table import Table
-import json
 
 # Import data access layer from extract_save.py
 from ..extract_save import (
     find_latest_autosave, find_last_n_autosaves, find_autosave_by_name,
     find_save_by_name, list_all_saves, get_save_info,
     get_output_directory, is_directory_cached, extract_save_files,
-    SaveExtractionError, SAVEFILES_PATH, get_all_autosaves, get_all_saves
+    SaveExtractionError, SAVEFILES_PATH, AUTOSAVES_PATH, get_all_autosaves, get_all_saves
 )
 
 console = Console()
 
+# Threads for loading bibite files; reads release the GIL, so extra threads
+# keep file I/O going while another thread parses
+LOAD_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+# Save name -> zip index, memoized on (autosaves mtime, savefiles mtime) so
+# repeated source-zip lookups in one run don't rescan and stat every save
+_SAVE_INDEX_CACHE: Dict[tuple, Dict[str, Path]] = {}
+
 class BibitesDataError(Exception):
     """Raised when data access operation fails."""
     pass
 
+def _dir_mtime_ns(directory: Path) -> Optional[int]:
+    """Directory mtime in ns, or None if it cannot be stat'ed."""
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _save_index() -> Dict[str, Path]:
+    """Map save name (zip stem) to zip path, autosaves taking precedence.
+    
+    Adding or removing a save changes its directory's mtime, which
+    invalidates the memoized index.
+    
+    Raises:
+        SaveExtractionError: If the save directories cannot be listed
+    """
+    key = (_dir_mtime_ns(AUTOSAVES_PATH), _dir_mtime_ns(SAVEFILES_PATH))
+    cached = _SAVE_INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached
+    all_saves = get_all_saves()
+    index = {}
+    for save in all_saves['autosaves'] + all_saves['manual']:
+        index.setdefault(save.stem, save)
+    _SAVE_INDEX_CACHE.clear()
+    _SAVE_INDEX_CACHE[key] = index
+    return index
+
+def clear_save_cache() -> None:
+    """Forget the memoized save index (for long-running processes)."""
+    _SAVE_INDEX_CACHE.clear()
+
 def resolve_data_paths(latest: bool, last: Optional[int], name: Optional[str], 
                       overwrite: bool = False) -> List[Path]:
     """
@@ -175,18 +216,10 @@ def get_zip_file_from_data_path(data_path: Path) -> Optional[Path]:
     dataset_name = data_path.name
     
     try:
-        # Search both autosaves and manual saves
-        all_saves = get_all_saves()
-        
-        # Check autosaves first
-        for save in all_saves['autosaves']:
-            if save.stem == dataset_name:
-                return save
-        
-        # Check manual saves
-        for save in all_saves['manual']:
-            if save.stem == dataset_name:
-                return save
+        # Search both autosaves and manual saves (autosaves first)
+        save = _save_index().get(dataset_name)
+        if save is not None:
+            return save
         
         raise BibitesDataError(f"Could not find source zip for dataset: {dataset_name}")
         
@@ -205,26 +238,34 @@ def load_bibites_from_directory(bibites_dir: Path) -> List[Dict[str, Any]]:
     Raises:
         BibitesDataError: If directory not found or loading fails
     """
+    # Parsing stack is imported here so save listing and path resolution don't load it
+    from ...core.parser import load_bb8_file, BB8ParseError
+    from .field_extraction import list_bb8_files
+    
     if not bibites_dir.exists():
         raise BibitesDataError(f"Bibites directory not found: {bibites_dir}")
     
+    def load_bibite(bb8_file: Path) -> Tuple[Optional[Dict[str, Any]], Optional[BB8ParseError]]:
+        """Load one .bb8 file, returning (data, None) or (None, error)."""
+        try:
+            # Shared orjson loader: parses raw bytes with the BOM stripped
+            return load_bb8_file(bb8_file), None
+        except BB8ParseError as e:
+            return None, e
+    
     bibites = []
-    bb8_files = list(bibites_dir.glob('*.bb8'))
+    bb8_files = list_bb8_files(bibites_dir)
     
     if not bb8_files:
         raise BibitesDataError(f"No .bb8 files found in {bibites_dir}")
     
-    for bb8_file in bb8_files:
-        try:
-            with open(bb8_file, 'r', encoding='utf-8') as f:
-                # Handle BOM if present
-                content = f.read()
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-                bibite_data = json.loads(content)
+    # Load on a thread pool; results (and warnings) keep directory order
+    with ThreadPoolExecutor(max_workers=LOAD_THREADS) as executor:
+        for bb8_file, (bibite_data, error) in zip(bb8_files, executor.map(load_bibite, bb8_files)):
+            if error is None:
                 bibites.append(bibite_data)
-        except (json.JSONDecodeError, IOError) as e:
-            console.print(f"[yellow]Warning: Failed to load {bb8_file.name}: {e}[/yellow]")
+            else:
+                console.print(f"[yellow]Warning: Failed to load {bb8_file.name}: {error}[/yellow]")
     
     if not bibites:
         raise BibitesDataError(f"Failed to load any valid bibite data from {bibites_dir}")
@@ -11,12 +11,13 @@ This module preserves the critical size-relative combat algorithm:
     combat_fitness = size_adjusted_damage + (size_kill_ratio * 100)
 """
 
+import heapq
 import statistics
 from typing import Dict, List, Optional, Any, Tuple
 from collections import defaultdict
 from pathlib import Path
 
-from .field_extraction import process_batch_files
+from .field_extraction import process_batch_files, DEFAULT_BATCH_SIZE
 from .analysis_utils import (
     load_and_validate_organism_data, group_organisms_by_species,
     filter_mature_organisms, find_top_performers, generate_insights,
@@ -29,7 +30,8 @@ from rich.table import Table
 console = Console()
 
 
-def calculate_combat_effectiveness(organisms: List[Dict], size_relative: bool = True) -> Dict:
+def calculate_combat_effectiveness(organisms: List[Dict], size_relative: bool = True,
+                                   top_k: int = 5, max_insights: Optional[int] = None) -> Dict:
     """Calculate comprehensive combat effectiveness metrics for organisms.
     
     This function implements the core size-relative combat algorithm that accounts
@@ -38,6 +40,8 @@ def calculate_combat_effectiveness(organisms: List[Dict], size_relative: bool =
     Args:
         organisms: List of organism dictionaries with combat data
         size_relative: If True, calculate size-adjusted combat metrics
+        top_k: Number of top performers to keep by combat fitness
+        max_insights: Optional cap on the number of insights returned
         
     Returns:
         Dictionary containing combat analysis results including top performers,
@@ -140,20 +144,19 @@ def calculate_combat_effectiveness(organisms: List[Dict], size_relative: bool =
     top_combat_fitness = []
     
     if mature_combatants:
+        # Partial selection instead of full sorts; nlargest keeps the same
+        # order as sorted(..., reverse=True)[:n], ties included
         # Top size-adjusted damage dealers
-        top_damage_dealers = sorted(mature_combatants, 
-                                   key=lambda x: x['size_adjusted_damage'], 
-                                   reverse=True)[:8]
+        top_damage_dealers = heapq.nlargest(8, mature_combatants,
+                                            key=lambda x: x['size_adjusted_damage'])
         
         # Top size-adjusted killers
-        top_killers = sorted(mature_combatants, 
-                            key=lambda x: x['size_kill_ratio'], 
-                            reverse=True)[:8]
+        top_killers = heapq.nlargest(8, mature_combatants,
+                                     key=lambda x: x['size_kill_ratio'])
         
         # Top overall combat efficiency
-        top_combat_fitness = sorted(mature_combatants, 
-                                   key=lambda x: x['combat_fitness'], 
-                                   reverse=True)[:5]
+        top_combat_fitness = heapq.nlargest(top_k, mature_combatants,
+                                            key=lambda x: x['combat_fitness'])
     
     # Generate ecosystem insights
     analysis_results = {
@@ -163,6 +166,8 @@ def calculate_combat_effectiveness(organisms: List[Dict], size_relative: bool =
         'total_mature': total_mature
     }
     insights = generate_insights(analysis_results, "combat")
+    if max_insights is not None:
+        insights = insights[:max_insights]
     
     return {
         'summary': {
@@ -482,10 +487,22 @@ def combat_reproductive_correlation(organisms: List[Dict]) -> Dict:
     }
 
 
+# Fields read by the combat analysis functions
+COMBAT_FIELDS = [
+    'genes.tag', 'genes.speciesID', 'genes.gen',
+    'body.mouth.totalDamageDealt', 'body.mouth.totalMurders', 'body.mouth.bibitesBitten',
+    'body.d2Size', 'body.eggLayer.nEggsLaid', 'body.energy', 'body.health',
+    'clock.timeAlive', 'body.control.totalTravel'
+]
+
+
 def run_combat_analysis_from_directory(bibites_dir: Path, 
                                      lineage_filter: str = None,
                                      size_relative: bool = True,
-                                     output: Optional[Path] = None) -> Dict:
+                                     output: Optional[Path] = None,
+                                     top_k: int = 5,
+                                     max_insights: Optional[int] = None,
+                                     batch_size: int = DEFAULT_BATCH_SIZE) -> Dict:
     """Run comprehensive combat analysis on a bibites directory.
     
     Main entry point for combat analysis that handles data loading and coordinates
@@ -496,23 +513,55 @@ def run_combat_analysis_from_directory(bibites_dir: Path,
         lineage_filter: Optional specific lineage to focus on
         size_relative: Whether to use size-relative combat metrics
         output: Optional output file for results
+        top_k: Number of top performers to keep by combat fitness
+        max_insights: Optional cap on the number of combat insights
+        batch_size: Maximum files per parallel parsing task
         
     Returns:
         Dictionary containing complete combat analysis results
     """
     console.print(f"[green]Starting combat analysis of {bibites_dir}...[/green]")
     
-    # Extract combat-relevant fields
-    combat_fields = [
-        'genes.tag', 'genes.speciesID', 'genes.gen',
-        'body.mouth.totalDamageDealt', 'body.mouth.totalMurders', 'body.mouth.bibitesBitten',
-        'body.d2Size', 'body.eggLayer.nEggsLaid', 'body.energy', 'body.health',
-        'clock.timeAlive', 'body.control.totalTravel'
-    ]
-    
     try:
-        results, errors = process_batch_files(bibites_dir, combat_fields)
+        results, errors = process_batch_files(bibites_dir, COMBAT_FIELDS, batch_size=batch_size)
+    except Exception as e:
+        console.print(f"[red]Combat analysis failed: {e}[/red]")
+        raise
+    
+    return run_combat_analysis_from_records(
+        bibites_dir, results, errors,
+        lineage_filter=lineage_filter,
+        size_relative=size_relative,
+        output=output,
+        top_k=top_k,
+        max_insights=max_insights
+    )
+
+
+def run_combat_analysis_from_records(bibites_dir: Path,
+                                     results: List[Dict],
+                                     errors: List[str],
+                                     lineage_filter: str = None,
+                                     size_relative: bool = True,
+                                     output: Optional[Path] = None,
+                                     top_k: int = 5,
+                                     max_insights: Optional[int] = None) -> Dict:
+    """Run comprehensive combat analysis on already-extracted organism records.
+    
+    Args:
+        bibites_dir: Directory the records were extracted from (recorded in meta)
+        results: Organism records containing COMBAT_FIELDS
+        errors: Error messages for files that failed to load
+        lineage_filter: Optional specific lineage to focus on
+        size_relative: Whether to use size-relative combat metrics
+        output: Optional output file for results
+        top_k: Number of top performers to keep by combat fitness
+        max_insights: Optional cap on the number of combat insights
         
+    Returns:
+        Dictionary containing complete combat analysis results
+    """
+    try:
         if errors:
             console.print(f"[yellow]Warning: {len(errors)} files had extraction errors[/yellow]")
         
@@ -520,7 +569,9 @@ def run_combat_analysis_from_directory(bibites_dir: Path,
             raise ValueError("No organism data extracted for combat analysis")
         
         # Run all combat analysis functions
-        combat_effectiveness = calculate_combat_effectiveness(results, size_relative=size_relative)
+        combat_effectiveness = calculate_combat_effectiveness(
+            results, size_relative=size_relative, top_k=top_k, max_insights=max_insights
+        )
         predator_patterns = analyze_predator_combat_patterns(results, lineage_filter=lineage_filter)
         reproductive_correlation = combat_reproductive_correlation(results)
         
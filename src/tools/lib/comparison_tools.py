@@ -11,6 +11,7 @@ from rich.console import Console
 from rich.table import Table
 
 from .population_analysis import get_cycle_species_data
+from .field_extraction import list_bb8_files
 from ...core.parser import load_bb8_file, extract_multiple_fields, BB8ParseError
 
 console = Console()
@@ -127,7 +128,7 @@ def compare_specific_species(directory_path: Path, species_a: int, species_b: in
     if directory_path.is_file():
         directory_path = directory_path.parent
     
-    bb8_files = list(directory_path.glob('*.bb8'))
+    bb8_files = list_bb8_files(directory_path)
     if not bb8_files:
         console.print(f"[red]No .bb8 files found in {directory_path}[/red]")
         return
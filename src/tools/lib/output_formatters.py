@@ -60,7 +60,12 @@ def display_csv(results: List[Dict[str, Any]], field_paths: List[str]):
 
 
 def save_json_output(data: Any, output_path):
-    """Save data as formatted JSON to file."""
+    """Save data as formatted JSON to file.
+    
+    Non-string dict keys (e.g. integer species IDs) are written as strings
+    rather than failing serialization.
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     with open(output_path, 'wb') as f:
-        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        f.write(payload)
     console.print(f"\n[green]Results saved to {output_path}[/green]")
\ No newline at end of file
@@ -5,6 +5,7 @@ Provides species distribution analysis, population summaries, and statistical
 calculations for ecosystem monitoring and evolutionary tracking.
 """
 
+import math
 import statistics
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -14,21 +15,36 @@ from rich.progress import track
 from rich.table import Table
 
 from ...core.parser import load_bb8_file, extract_multiple_fields, BB8ParseError
+from .field_extraction import extract_records, list_bb8_files
 
 console = Console()
 
+# Fields read by the quick population counts and the detailed species summary
+QUICK_POPULATION_FIELDS = ['genes.tag', 'genes.speciesID']
+SPECIES_SUMMARY_FIELDS = ['genes.tag', 'genes.genes.SpeciesID', 'energy', 'age',
+                          'genes.genes.ColorR', 'genes.genes.ColorG', 'genes.genes.ColorB']
+
 
 def calculate_stats(values: List[float]) -> Dict[str, float]:
     """Calculate basic statistics for a list of values."""
     if not values:
         return {}
     
+    # math.fsum gives a correctly rounded sum in C; statistics.mean/stdev go
+    # through exact fractions and dominate per-species reductions
+    count = len(values)
+    mean = math.fsum(values) / count
+    if count > 1:
+        std = math.sqrt(math.fsum([(v - mean) ** 2 for v in values]) / (count - 1))
+    else:
+        std = 0.0
+    
     return {
-        'mean': statistics.mean(values),
-        'std': statistics.stdev(values) if len(values) > 1 else 0.0,
+        'mean': mean,
+        'std': std,
         'min': min(values),
         'max': max(values),
-        'count': len(values)
+        'count': count
     }
 
 
@@ -50,7 +66,7 @@ def get_cycle_species_data(cycle_path: Path, cycle_name: str) -> Dict[str, int]:
     if cycle_path.is_file():
         cycle_path = cycle_path.parent
     
-    bb8_files = list(cycle_path.glob('*.bb8'))
+    bb8_files = list_bb8_files(cycle_path)
     if not bb8_files:
         console.print(f"[red]No .bb8 files found in {cycle_path} for cycle {cycle_name}[/red]")
         return {}
@@ -84,26 +100,34 @@ def get_cycle_species_data(cycle_path: Path, cycle_name: str) -> Dict[str, int]:
 
 def generate_quick_population_summary(bb8_files: List[Path], output: Optional[Path], use_species_id: bool = False):
     """Generate a quick population count table using genes.tag or species ID for species identification."""
+    description = "Analyzing species breakdown" if use_species_id else "Counting species"
+    records, errors = extract_records(bb8_files, QUICK_POPULATION_FIELDS, description)
+    generate_quick_population_summary_from_records(records, len(errors), output, use_species_id)
+
+
+def generate_quick_population_summary_from_records(records: List[Dict[str, Any]], errors: int,
+                                                   output: Optional[Path], use_species_id: bool = False):
+    """Quick population count table from already-extracted organism records.
+    
+    Args:
+        records: Organism records containing QUICK_POPULATION_FIELDS
+        errors: Number of files that failed to load
+        output: Optional JSON output file
+        use_species_id: Break each tag down by sim-generated species ID
+    """
+    organism_count = len(records) + errors
     
     if use_species_id:
-        console.print(f"[blue]Analyzing {len(bb8_files)} organisms by species within hereditary tags...[/blue]")
+        console.print(f"[blue]Analyzing {organism_count} organisms by species within hereditary tags...[/blue]")
         
         # Collect both tag and species ID for breakdown analysis
         tag_species_breakdown = defaultdict(lambda: defaultdict(int))
-        errors = 0
         
-        for file_path in track(bb8_files, description="Analyzing species breakdown"):
-            try:
-                data = load_bb8_file(file_path)
-                extracted = extract_multiple_fields(data, ['genes.tag', 'genes.speciesID'])
-                
-                tag = extracted.get('genes.tag', 'Unknown')
-                species_id = extracted.get('genes.speciesID', 'Unknown')
-                
-                tag_species_breakdown[tag][species_id] += 1
-                
-            except BB8ParseError:
-                errors += 1
+        for extracted in records:
+            tag = extracted.get('genes.tag', 'Unknown')
+            species_id = extracted.get('genes.speciesID', 'Unknown')
+            
+            tag_species_breakdown[tag][species_id] += 1
         
         # Display breakdown table
         console.print("\n[bold]Population Summary (By Species)[/bold]")
@@ -154,29 +178,20 @@ def generate_quick_population_summary(bb8_files: List[Path], output: Optional[Pa
             console.print(f"\n[green]Summary saved to {output}[/green]")
         
     else:
-        console.print(f"[blue]Counting {len(bb8_files)} organisms by species tag...[/blue]")
+        console.print(f"[blue]Counting {organism_count} organisms by species tag...[/blue]")
         
         species_counter = Counter()
-        errors = 0
         
-        for file_path in track(bb8_files, description="Counting species"):
-            try:
-                data = load_bb8_file(file_path)
-                
-                # Try genes.tag first (preferred for quick identification)
-                tag_extracted = extract_multiple_fields(data, ['genes.tag'])
-                species_tag = tag_extracted.get('genes.tag')
-                
-                if species_tag:
-                    species_counter[species_tag] += 1
-                else:
-                    # Fallback to SpeciesID if tag not available  
-                    extracted = extract_multiple_fields(data, ['genes.speciesID'])
-                    species_id = extracted.get('genes.speciesID', 'Unknown')
-                    species_counter[species_id] += 1
-                    
-            except BB8ParseError:
-                errors += 1
+        for extracted in records:
+            # Try genes.tag first (preferred for quick identification)
+            species_tag = extracted.get('genes.tag')
+            
+            if species_tag:
+                species_counter[species_tag] += 1
+            else:
+                # Fallback to SpeciesID if tag not available  
+                species_id = extracted.get('genes.speciesID', 'Unknown')
+                species_counter[species_id] += 1
         
         # Display quick table
         console.print("\n[bold]Population Summary[/bold]")
@@ -220,7 +235,7 @@ def generate_species_summary(input_path: Path, output: Optional[Path], quick_mod
     if input_path.is_file():
         input_path = input_path.parent
     
-    bb8_files = list(input_path.glob('*.bb8'))
+    bb8_files = list_bb8_files(input_path)
     if not bb8_files:
         console.print(f"[red]No .bb8 files found in {input_path}[/red]")
         return
@@ -229,48 +244,51 @@ def generate_species_summary(input_path: Path, output: Optional[Path], quick_mod
     if quick_mode:
         generate_quick_population_summary(bb8_files, output, use_species_id)
         return
-        
-    console.print(f"[blue]Analyzing {len(bb8_files)} organisms for species distribution...[/blue]")
+    
+    records, errors = extract_records(bb8_files, SPECIES_SUMMARY_FIELDS, "Analyzing organisms")
+    generate_species_summary_from_records(records, errors, output)
+
+
+def generate_species_summary_from_records(records: List[Dict[str, Any]], errors: List[str],
+                                          output: Optional[Path]):
+    """Species distribution summary from already-extracted organism records.
+    
+    Args:
+        records: Organism records containing SPECIES_SUMMARY_FIELDS and '_file'
+        errors: Error messages for files that failed to load
+        output: Optional JSON output file
+    """
+    organism_count = len(records) + len(errors)
+    console.print(f"[blue]Analyzing {organism_count} organisms for species distribution...[/blue]")
     
     species_data = defaultdict(list)
     energy_data = []
     age_data = []
-    errors = []
-    
-    # Key fields for species analysis
-    species_fields = ['genes.tag', 'genes.genes.SpeciesID', 'energy', 'age', 'genes.genes.ColorR', 'genes.genes.ColorG', 'genes.genes.ColorB']
     
-    for file_path in track(bb8_files, description="Analyzing organisms"):
-        try:
-            data = load_bb8_file(file_path)
-            extracted = extract_multiple_fields(data, species_fields)
-            
-            # Prefer genes.tag, fall back to SpeciesID
-            species_id = extracted.get('genes.tag') or extracted.get('genes.genes.SpeciesID', 'Unknown')
-            energy = extracted.get('energy', 0)
-            age = extracted.get('age', 0)
-            color_r = extracted.get('genes.genes.ColorR', 0)
-            color_g = extracted.get('genes.genes.ColorG', 0)
-            color_b = extracted.get('genes.genes.ColorB', 0)
-            
-            species_data[species_id].append({
-                'file': file_path.name,
-                'energy': energy,
-                'age': age,
-                'color': (color_r, color_g, color_b)
-            })
-            
-            if isinstance(energy, (int, float)):
-                energy_data.append(energy)
-            if isinstance(age, (int, float)):
-                age_data.append(age)
-                
-        except BB8ParseError as e:
-            errors.append(f"{file_path.name}: {e}")
+    for extracted in records:
+        # Prefer genes.tag, fall back to SpeciesID
+        species_id = extracted.get('genes.tag') or extracted.get('genes.genes.SpeciesID', 'Unknown')
+        energy = extracted.get('energy', 0)
+        age = extracted.get('age', 0)
+        color_r = extracted.get('genes.genes.ColorR', 0)
+        color_g = extracted.get('genes.genes.ColorG', 0)
+        color_b = extracted.get('genes.genes.ColorB', 0)
+        
+        species_data[species_id].append({
+            'file': extracted.get('_file'),
+            'energy': energy,
+            'age': age,
+            'color': (color_r, color_g, color_b)
+        })
+        
+        if isinstance(energy, (int, float)):
+            energy_data.append(energy)
+        if isinstance(age, (int, float)):
+            age_data.append(age)
     
     # Generate summary
     summary = {
-        'total_organisms': len(bb8_files),
+        'total_organisms': organism_count,
         'species_count': len(species_data),
         'species_distribution': {},
         'energy_stats': calculate_stats(energy_data) if energy_data else None,
@@ -285,7 +303,7 @@ def generate_species_summary(input_path: Path, output: Optional[Path], quick_mod
         
         summary['species_distribution'][species_id] = {
             'count': len(organisms),
-            'percentage': (len(organisms) / len(bb8_files)) * 100,
+            'percentage': (len(organisms) / organism_count) * 100,
             'avg_energy': statistics.mean(species_energies) if species_energies else 0,
             'avg_age': statistics.mean(species_ages) if species_ages else 0,
             'dominant_color': get_dominant_color([org['color'] for org in organisms])
@@ -11,15 +11,17 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from collections import defaultdict
 from rich.console import Console
-from rich.progress import track
 from rich.table import Table
 
-from ...core.parser import load_bb8_file, extract_multiple_fields, BB8ParseError
 from .bibites_data import get_zip_file_from_data_path
 from ..extract_metadata import extract_metadata_from_save
+from .field_extraction import extract_records, list_bb8_files
 
 console = Console()
 
+# Fields read by the spatial analysis
+SPATIAL_FIELDS = ['rb2d.px', 'rb2d.py', 'genes.tag']
+
 
 def calculate_distance_from_center(x: float, y: float) -> float:
     """Calculate radial distance from ecosystem center (0,0)."""
@@ -223,12 +225,26 @@ def generate_spatial_analysis(input_path: Path, output: Optional[Path]):
     if input_path.is_file():
         input_path = input_path.parent
     
-    bb8_files = list(input_path.glob('*.bb8'))
+    bb8_files = list_bb8_files(input_path)
     if not bb8_files:
         console.print(f"[red]No .bb8 files found in {input_path}[/red]")
         return
     
-    console.print(f"[blue]Analyzing spatial distribution of {len(bb8_files)} organisms across concentric zones...[/blue]")
+    records, errors = extract_records(bb8_files, SPATIAL_FIELDS, "Analyzing positions")
+    generate_spatial_analysis_from_records(input_path, records, errors, output)
+
+
+def generate_spatial_analysis_from_records(input_path: Path, records: List[Dict[str, Any]],
+                                           errors: List[str], output: Optional[Path]):
+    """Spatial distribution analysis from already-extracted organism records.
+    
+    Args:
+        input_path: Bibites directory, used to locate the save's zone configuration
+        records: Organism records containing SPATIAL_FIELDS and '_file'
+        errors: Error messages for files that failed to load
+        output: Optional JSON output file
+    """
+    console.print(f"[blue]Analyzing spatial distribution of {len(records) + len(errors)} organisms across concentric zones...[/blue]")
     
     # Parse zone configuration and extract world radius
     zones = parse_zone_configuration(input_path)
@@ -259,34 +275,25 @@ def generate_spatial_analysis(input_path: Path, output: Optional[Path]):
     zone_species_data = defaultdict(lambda: defaultdict(list))
     zone_totals = defaultdict(int)
     species_zone_data = defaultdict(lambda: defaultdict(int))
-    position_fields = ['rb2d.px', 'rb2d.py', 'genes.tag']
-    errors = []
     
-    for file_path in track(bb8_files, description="Analyzing positions"):
-        try:
-            data = load_bb8_file(file_path)
-            extracted = extract_multiple_fields(data, position_fields)
-            
-            x = extracted.get('rb2d.px')
-            y = extracted.get('rb2d.py') 
-            species = extracted.get('genes.tag', 'unknown')
-            if species is None:
-                species = 'None'
-            
-            if x is not None and y is not None:
-                zone = classify_zone_concentric(x, y, zones, world_radius) if zones else "Unknown"
-                distance = calculate_distance_from_center(x, y)
-                zone_species_data[zone][species].append({
-                    'file': file_path.name,
-                    'x': x,
-                    'y': y,
-                    'distance': distance
-                })
-                zone_totals[zone] += 1
-                species_zone_data[species][zone] += 1
-                
-        except BB8ParseError as e:
-            errors.append(f"{file_path.name}: {e}")
+    for extracted in records:
+        x = extracted.get('rb2d.px')
+        y = extracted.get('rb2d.py') 
+        species = extracted.get('genes.tag', 'unknown')
+        if species is None:
+            species = 'None'
+        
+        if x is not None and y is not None:
+            zone = classify_zone_concentric(x, y, zones, world_radius) if zones else "Unknown"
+            distance = calculate_distance_from_center(x, y)
+            zone_species_data[zone][species].append({
+                'file': extracted.get('_file'),
+                'x': x,
+                'y': y,
+                'distance': distance
+            })
+            zone_totals[zone] += 1
+            species_zone_data[species][zone] += 1
     
     # Calculate zone statistics
     total_organisms = sum(zone_totals.values())